@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+
+class Import:
+    # Each import runs in a fresh interpreter
+    def timeraw_package(self):
+        return "import escodrinyar"
+
+    def timeraw_sketch(self):
+        return "from escodrinyar import QuantileSketch"
+
+    def timeraw_agg2d(self):
+        return "from escodrinyar import Agg2d"
+
+    def timeraw_layout(self):
+        return "from escodrinyar import Layout"
+
+    def track_heavy_modules(self):
+        # Modules imported by `import escodrinyar` that it should defer; any
+        # value above zero is a regression
+        code = (
+            "import sys, escodrinyar;"
+            "heavy = ['seaborn', 'matplotlib', 'scipy', 'pandas'];"
+            "print(sum(m in sys.modules for m in heavy))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        return int(result.stdout)
+
+    track_heavy_modules.unit = "modules"
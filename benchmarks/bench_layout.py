@@ -0,0 +1,63 @@
+import seaborn.objects as so
+
+import escodrinyar as es
+from escodrinyar import cache
+
+from .common import draw, points, savefig
+
+
+def _layout(cells, rows):
+    data = points(rows, 3)
+    plots = [
+        es.Plot(data=data, x="x", y="y", color="group").add(so.Dot(marker=".")),
+        es.Plot(data=data, x="x", y="y", color="group").add(es.ConvexHull()),
+        es.Plot(data=data, x="x", y="y").add(es.Tile(), es.Bin2d()),
+        es.Plot(data=data, x="x", y="y", color="group").add(so.Dot(), es.Agg2d()),
+    ]
+    ncols = min(cells, 8)
+    grid = [
+        [plots[(i + j) % len(plots)] for j in range(ncols)]
+        for i in range(0, cells, ncols)
+    ]
+    return es.Layout(grid).opts(figsize=(2 * ncols, 2 * len(grid)))
+
+
+class Layouts:
+    params = ([1, 4, 16, 64], [10**3, 10**5])
+    param_names = ["cells", "rows"]
+    timeout = 900
+
+    def setup(self, cells, rows):
+        cache.disable()
+        self.layout = _layout(cells, rows)
+        self.layout.plot()
+
+    def time_plot(self, cells, rows):
+        es.Layout(self.layout.layout).opts(self.layout.figsize).plot()
+
+    def time_replot_unchanged(self, cells, rows):
+        self.layout.plot()
+
+    def time_draw(self, cells, rows):
+        draw(self.layout.fig)
+
+    def time_savefig(self, cells, rows):
+        savefig(self.layout.fig)
+
+    def peakmem_plot(self, cells, rows):
+        es.Layout(self.layout.layout).opts(self.layout.figsize).plot()
+
+
+class VectorLayouts:
+    # Vector output of large scatters is dominated by writing each marker
+    params = ([1, 4, 16, 64], ["svg", "pdf"])
+    param_names = ["cells", "format"]
+    timeout = 900
+
+    def setup(self, cells, format):
+        cache.disable()
+        self.layout = _layout(cells, 10**3)
+        self.layout.plot()
+
+    def time_savefig(self, cells, format):
+        savefig(self.layout.fig, format)
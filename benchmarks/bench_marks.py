@@ -0,0 +1,99 @@
+from seaborn._core.groupby import GroupBy
+
+import escodrinyar as es
+from escodrinyar import cache
+
+from .common import draw, points, rects, ring, savefig, tiles
+
+
+def _plot(mark, rows, groups):
+    """Return a plot of `mark` whose stat, if any, is already computed."""
+    if mark in ["Tile", "Tile(raster=True)"]:
+        # A heatmap of about `rows` tiles
+        tile = es.Tile(raster=mark != "Tile")
+        return es.Plot(
+            data=tiles(rows, groups), x="x", y="y", color="value", group="group"
+        ).add(tile)
+    if mark == "Rect":
+        data = rects(rows, groups)
+        return es.Plot(
+            data=data, xmin="xmin", xmax="xmax", ymin="ymin", ymax="ymax", color="group"
+        ).add(es.Rect())
+    data = points(rows, groups)
+    groupby = GroupBy(["group"])
+    if mark == "HexTile":
+        hexagons = es.Hex2d()(data, groupby, "x", {})
+        return es.Plot(data=hexagons, x="x", y="y", color="color").add(
+            es.HexTile(), tilewidth="tilewidth", tileheight="tileheight"
+        )
+    if mark == "Contour":
+        density = es.KDE2d()(data, groupby, "x", {})
+        return es.Plot(data=density, x="x", y="y", color="group").add(
+            es.Contour(), density="density"
+        )
+    return es.Plot(data=data, x="x", y="y", color="group").add(getattr(es, mark)())
+
+
+class Marks:
+    params = (
+        [
+            "Rect",
+            "Tile",
+            "Tile(raster=True)",
+            "HexTile",
+            "Polygon",
+            "ConvexHull",
+            "Contour",
+            "Pixels",
+            "Limits",
+        ],
+        [10**3, 10**5, 10**7],
+        [1, 100, 10**4],
+    )
+    param_names = ["mark", "rows", "groups"]
+    timeout = 600
+
+    def setup(self, mark, rows, groups):
+        if groups > rows:
+            raise NotImplementedError
+        if mark in ["HexTile", "Contour"] and groups > 100:
+            # Grids of binning and density stats are per group
+            raise NotImplementedError
+        if mark == "Polygon" and rows > 10**5:
+            # Outlines of random points are not simplified
+            raise NotImplementedError
+        cache.disable()
+        self.plot = _plot(mark, rows, groups)
+        self.layout = es.Layout([[self.plot]]).plot()
+
+    def time_plot(self, mark, rows, groups):
+        es.Layout([[self.plot]]).plot()
+
+    def time_draw(self, mark, rows, groups):
+        draw(self.layout.fig)
+
+    def time_savefig(self, mark, rows, groups):
+        savefig(self.layout.fig)
+
+    def peakmem_plot(self, mark, rows, groups):
+        es.Layout([[self.plot]]).plot()
+
+
+class SimplifiedPolygons:
+    # Outlines much denser than the pixels, whose vertices jitter across a
+    # fraction of a pixel (1e-3) or a few pixels (3e-2)
+    params = ([10**4, 10**6], [1e-3, 3e-2], [None, 1], ["png", "svg"])
+    param_names = ["rows", "noise", "simplify", "format"]
+    # Simplified outlines are cached by the figure, so each one is saved once
+    number = 1
+    repeat = 5
+    timeout = 600
+
+    def setup(self, rows, noise, simplify, format):
+        data = ring(rows, noise)
+        polygon = es.Polygon(simplify=simplify)
+        self.layout = es.Layout([[es.Plot(data=data, x="x", y="y").add(polygon)]])
+        self.layout.plot()
+
+    def time_savefig(self, rows, noise, simplify, format):
+        savefig(self.layout.fig, format)
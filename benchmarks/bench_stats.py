@@ -0,0 +1,48 @@
+from seaborn._core.groupby import GroupBy
+
+import escodrinyar as es
+from escodrinyar import cache
+
+from .common import points
+
+
+class Stats:
+    params = (
+        ["Agg2d", "Bin2d", "Hex2d", "KDE2d"],
+        [10**3, 10**5, 10**7],
+        [1, 100, 10**4],
+    )
+    param_names = ["stat", "rows", "groups"]
+    timeout = 600
+
+    def setup(self, stat, rows, groups):
+        if groups > rows or (stat != "Agg2d" and groups > 100):
+            # Grids of binning and density stats are per group
+            raise NotImplementedError
+        cache.disable()
+        self.data = points(rows, groups)
+        self.stat = getattr(es, stat)()
+        self.groupby = GroupBy(["group"])
+
+    def time_stat(self, stat, rows, groups):
+        self.stat(self.data, self.groupby, "x", {})
+
+    def peakmem_stat(self, stat, rows, groups):
+        self.stat(self.data, self.groupby, "x", {})
+
+
+class Chunked:
+    params = [10**5, 10**7]
+    param_names = ["rows"]
+    timeout = 600
+
+    def setup(self, rows):
+        cache.disable()
+        data = points(rows, 100)
+        self.chunks = [data[i:i + 10**6] for i in range(0, rows, 10**6)]
+
+    def time_summarize(self, rows):
+        es.Plot(data=iter(self.chunks), x="x", y="y", color="group")
+
+    def peakmem_summarize(self, rows):
+        es.Plot(data=iter(self.chunks), x="x", y="y", color="group")
@@ -0,0 +1,77 @@
+"""
+Synthetic data shared by the benchmarks.
+"""
+import io
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+def points(rows, groups=1, seed=0):
+    """Return `rows` normal points in `groups` clusters, labelled in `group`."""
+    rng = np.random.default_rng(seed)
+    codes = rng.integers(0, groups, rows)
+    offset = codes / max(groups - 1, 1) * 10
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=rows) + offset,
+            "y": rng.normal(size=rows) - offset,
+            "group": _labels(codes, groups),
+        }
+    )
+
+
+def _labels(codes, groups):
+    levels = np.array([f"g{i:05d}" for i in range(groups)], dtype=object)
+    return pd.Categorical.from_codes(codes, levels)
+
+
+def tiles(rows, groups=1, seed=0):
+    """
+    Return the unit tiles of a square grid of about `rows` cells, with a
+    random `value` and `group`.
+    """
+    rng = np.random.default_rng(seed)
+    side = max(int(np.sqrt(rows)), 1)
+    x, y = np.divmod(np.arange(side**2), side)
+    return pd.DataFrame(
+        {
+            "x": x.astype(float),
+            "y": y.astype(float),
+            "value": rng.random(side**2),
+            "group": _labels(rng.integers(0, groups, side**2), groups),
+        }
+    )
+
+
+def rects(rows, groups=1, seed=0):
+    """Return `rows` rectangles of random extents, labelled in `group`."""
+    rng = np.random.default_rng(seed)
+    x, y = rng.uniform(0, 100, (2, rows))
+    width, height = rng.exponential(0.5, (2, rows))
+    return pd.DataFrame(
+        {
+            "xmin": x,
+            "xmax": x + width,
+            "ymin": y,
+            "ymax": y + height,
+            "group": _labels(rng.integers(0, groups, rows), groups),
+        }
+    )
+
+
+def ring(rows, noise, seed=0):
+    """Return `rows` vertices of the unit circle, with radial normal `noise`."""
+    rng = np.random.default_rng(seed)
+    theta = np.linspace(0, 2 * np.pi, rows, endpoint=False)
+    radius = 1 + noise * rng.normal(size=rows)
+    return pd.DataFrame({"x": radius * np.cos(theta), "y": radius * np.sin(theta)})
+
+
+def draw(fig):
+    FigureCanvasAgg(fig).draw()
+
+
+def savefig(fig, format="png"):
+    fig.savefig(io.BytesIO(), format=format)
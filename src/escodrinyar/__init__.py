@@ -1,14 +1,79 @@
-from .layout import Layout, Plot
-from .marks.area import Polygon, ConvexHull
-from .marks.rect import Rect, Tile
-from .stats.aggregation import Agg2d
+import importlib
+from typing import TYPE_CHECKING
+
+# Objects are imported on first access, so that importing the package does not
+# import seaborn, matplotlib or scipy before they are needed
+_OBJECTS = {
+    "Chunks": ".chunks",
+    "export": "._export",
+    "Layout": ".layout",
+    "Plot": ".layout",
+    "RenderService": ".service",
+    "Polygon": ".marks.area",
+    "ConvexHull": ".marks.area",
+    "Contour": ".marks.area",
+    "Pixels": ".marks.pixel",
+    "Limits": ".marks.limits",
+    "Rect": ".marks.rect",
+    "Tile": ".marks.rect",
+    "HexTile": ".marks.rect",
+    "Agg2d": ".stats.aggregation",
+    "Bin2d": ".stats.binning",
+    "Hex2d": ".stats.binning",
+    "KDE2d": ".stats.density",
+    "ApproxQuantile": ".stats.sketch",
+    "QuantileSketch": ".stats.sketch",
+}
+_SUBMODULES = ["cache", "profile", "spec"]
 
 __all__ = [
+    "Chunks",
+    "export",
     "Layout",
     "Plot",
+    "RenderService",
     "Polygon",
     "ConvexHull",
+    "Contour",
+    "Pixels",
+    "Limits",
     "Rect",
     "Tile",
+    "HexTile",
     "Agg2d",
+    "Bin2d",
+    "Hex2d",
+    "KDE2d",
+    "ApproxQuantile",
+    "QuantileSketch",
 ]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _OBJECTS:
+        value = getattr(importlib.import_module(_OBJECTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_OBJECTS, *_SUBMODULES])
+
+
+if TYPE_CHECKING:
+    from . import cache, profile, spec
+    from .chunks import Chunks
+    from ._export import export
+    from .layout import Layout, Plot
+    from .service import RenderService
+    from .marks.area import Polygon, ConvexHull, Contour
+    from .marks.pixel import Pixels
+    from .marks.limits import Limits
+    from .marks.rect import Rect, Tile, HexTile
+    from .stats.aggregation import Agg2d
+    from .stats.binning import Bin2d, Hex2d
+    from .stats.density import KDE2d
+    from .stats.sketch import ApproxQuantile, QuantileSketch
@@ -0,0 +1,138 @@
+"""
+Batch export of many layouts, each rendered once and written to any number of
+files.
+"""
+from __future__ import annotations
+
+import io
+import os
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+from .layout import Layout, Plot, _close, _savefig
+
+
+def export(
+    items: Iterable[tuple[Layout | Plot, str | os.PathLike | list]],
+    pdf: str | os.PathLike | None = None,
+    n_jobs: int | None = None,
+    **kwargs,
+) -> list[str]:
+    """
+    Render each layout once and write it to all of its targets.
+
+    Figures are closed as soon as they are written, so memory use does not
+    grow with the number of layouts.
+
+    Parameters
+    ----------
+    items : iterable of (Layout or Plot, path or list of paths) tuples
+        The layouts and the files where each of them is written. The format
+        of each file is inferred from its extension (e.g., PNG, SVG, PDF).
+        The iterable is consumed lazily, so it can be a generator.
+    pdf : str or path
+        A PDF file where all layouts are also written, one page each, in the
+        order of `items`. Default is None.
+    n_jobs : int
+        Number of worker processes that render the layouts (-1 uses all
+        CPUs). Each worker writes the files of its layouts, and the pages of
+        `pdf` are merged by the calling process, which requires `pypdf`.
+        Default is None (sequential).
+    kwargs
+        Passed to :meth:`matplotlib.figure.Figure.savefig` for every file,
+        e.g. `dpi` or `bbox_inches`.
+
+    Returns
+    -------
+    list of str
+        The paths of the written files, in order.
+
+    """
+    written = []
+    if n_jobs in (None, 1):
+        pages = None
+        if pdf is not None:
+            from matplotlib.backends.backend_pdf import PdfPages
+
+            pages = PdfPages(pdf)
+        try:
+            for layout, targets in items:
+                paths, _ = _export_layout(layout, targets, kwargs, pages=pages)
+                written += paths
+        finally:
+            if pages is not None:
+                pages.close()
+    else:
+        # Figures cannot be sent between processes, so workers send the
+        # bytes of their page instead
+        if pdf is not None:
+            try:
+                from pypdf import PdfWriter
+            except ImportError as err:
+                raise ImportError(
+                    "Writing a PDF of layouts rendered in parallel requires pypdf."
+                ) from err
+            writer = PdfWriter()
+
+        max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(max_workers) as pool:
+            for paths, page in _imap(
+                pool, _export_layout, items, kwargs, pdf is not None,
+                window=2 * max_workers,
+            ):
+                written += paths
+                if page is not None:
+                    writer.append(io.BytesIO(page))
+
+        if pdf is not None:
+            with open(pdf, "wb") as f:
+                writer.write(f)
+
+    if pdf is not None:
+        written.append(os.fspath(pdf))
+    return written
+
+
+def _imap(pool, func, items, *args, window):
+    # Unlike `pool.map`, only a window of items is read ahead, so that long
+    # generators are neither materialized nor their results held in memory
+    pending = deque()
+    for layout, targets in items:
+        pending.append(pool.submit(func, layout, targets, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _export_layout(layout, targets, kwargs, page=False, pages=None):
+    """Write `layout` to `targets`, and return the paths and the PDF page."""
+    if isinstance(layout, Plot):
+        layout = Layout([[layout]])
+    if isinstance(targets, (str, os.PathLike)):
+        targets = [targets]
+    paths = [os.fspath(target) for target in targets]
+
+    try:
+        for path in paths:
+            # Cells are only redrawn if the format needs another rendering
+            layout._plot_for(path, kwargs)
+            _savefig(layout.fig, path, **kwargs)
+        # Pages are PDF, whatever the format given for the targets
+        kwargs = {key: value for key, value in kwargs.items() if key != "format"}
+        if pages is not None or page:
+            layout._plot_for(None, {**kwargs, "format": "pdf"})
+        if pages is not None:
+            pages.savefig(layout.fig, **kwargs)
+        if page:
+            buffer = io.BytesIO()
+            layout.fig.savefig(buffer, format="pdf", **kwargs)
+            page = buffer.getvalue()
+        else:
+            page = None
+    finally:
+        _close(layout.fig)
+        layout.fig = None
+        layout._rendered = {}
+    return paths, page
@@ -0,0 +1,256 @@
+"""
+Opt-in memoization of Stat computations, addressed by the content of their
+input data and parameters.
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pickle
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+from cycler import Cycler
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+class StatCache:
+    """
+    A least-recently-used cache of Stat results.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of results kept in memory.
+    directory : str or None
+        Directory where results are also pickled, so that they survive the
+        process. Default is None (memory only).
+    """
+
+    def __init__(self, maxsize: int = 128, directory: str | None = None):
+        self.maxsize = maxsize
+        self.directory = directory
+        if directory is not None:
+            self.directory = os.path.expanduser(directory)
+            os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, Any] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+
+        if self.directory is not None:
+            path = self._path(key)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+                self._remember(key, value)
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        return _MISSING
+
+    def set(self, key: str, value: Any):
+        self._remember(key, value)
+        if self.directory is not None:
+            # Write then rename, so that concurrent readers never see a
+            # partially written file
+            path = self._path(key)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+
+    def clear(self):
+        """Remove all the results from memory and reset the counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def _remember(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+
+_cache: StatCache | None = None
+
+
+def enable(maxsize: int = 128, directory: str | None = None) -> StatCache:
+    """
+    Enable the memoization of Stat results.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of results kept in memory.
+    directory : str or None
+        Directory where results are also stored on disk. Default is None.
+
+    Returns
+    -------
+    StatCache
+        The active cache.
+    """
+    global _cache
+    _cache = StatCache(maxsize, directory)
+    return _cache
+
+
+def disable():
+    """Disable the memoization of Stat results and drop the active cache."""
+    global _cache
+    _cache = None
+
+
+def info() -> CacheInfo | None:
+    """Return the counters of the active cache, or None if it is disabled."""
+    return None if _cache is None else _cache.info()
+
+
+def clear():
+    """Empty the in-memory part of the active cache and reset its counters."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def is_enabled() -> bool:
+    """Return whether the memoization of Stat results is enabled."""
+    return _cache is not None
+
+
+def lookup(key: str | None) -> Any:
+    """
+    Return a copy of the cached result for `key`, or None on a miss.
+
+    Results are copied on the way in and out of the cache, as seaborn modifies
+    stat results in place.
+    """
+    if _cache is None or key is None:
+        return None
+    value = _cache.get(key)
+    return None if value is _MISSING else value.copy()
+
+
+def store(key: str | None, value: Any):
+    """Store a copy of `value` under `key` in the active cache, if any."""
+    if _cache is not None and key is not None:
+        _cache.set(key, value.copy())
+
+
+def memoize(key: str | None, func: Callable[[], Any]) -> Any:
+    """Return the cached result for `key`, computing it with `func` on a miss."""
+    value = lookup(key)
+    if value is None:
+        value = func()
+        store(key, value)
+    return value
+
+
+def hash_key(*parts: Any) -> str | None:
+    """
+    Build a cache key from data and parameters.
+
+    Pandas objects and arrays are hashed by content, and containers and
+    dataclasses by their items. Other parts are hashed by their
+    representation, except for callables, which cannot be addressed by
+    content and make the result uncacheable (None is returned).
+    """
+    h = hashlib.blake2b(digest_size=20)
+    try:
+        for part in parts:
+            _update(h, part)
+    except _Uncacheable:
+        return None
+    return h.hexdigest()
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _update(h, part):
+    if isinstance(part, pd.DataFrame):
+        h.update(repr([(str(c), str(t)) for c, t in part.dtypes.items()]).encode())
+        h.update(_hash_pandas(part))
+    elif isinstance(part, pd.Series):
+        h.update(repr((part.name, str(part.dtype))).encode())
+        h.update(_hash_pandas(part))
+    elif isinstance(part, np.ndarray):
+        h.update(repr((part.dtype.str, part.shape)).encode())
+        h.update(np.ascontiguousarray(part).tobytes())
+    elif isinstance(part, (list, tuple)):
+        h.update(f"{type(part).__name__}[{len(part)}]".encode())
+        for item in part:
+            _update(h, item)
+    elif isinstance(part, dict):
+        h.update(f"dict[{len(part)}]".encode())
+        for key, value in part.items():
+            _update(h, key)
+            _update(h, value)
+    elif dataclasses.is_dataclass(part) and not isinstance(part, type):
+        # Stats are callable, but they are addressed by their parameters; the
+        # attributes also cover state set after init, such as scale ticks
+        h.update(type(part).__qualname__.encode())
+        if hasattr(part, "__dict__"):
+            _update(h, vars(part))
+        else:
+            _update(h, {f.name: getattr(part, f.name) for f in dataclasses.fields(part)})
+    elif callable(part) and not isinstance(part, Cycler):
+        raise _Uncacheable
+    else:
+        h.update(repr(part).encode())
+
+
+def _hash_pandas(obj):
+    try:
+        hashes = pd.util.hash_pandas_object(obj, index=False)
+    except TypeError:
+        # Object columns holding unhashable values, e.g. lists or dicts
+        raise _Uncacheable
+    return hashes.to_numpy().tobytes()
+
+
+def cached_stat(call: Callable) -> Callable:
+    """
+    Memoize the ``__call__`` method of a dataclass Stat.
+
+    The key covers the stat type and parameters, the input data, the grouping
+    variables and their order, and the orientation. Scales are not part of the
+    key, so stats whose result depends on them should not use this decorator.
+    """
+
+    @wraps(call)
+    def wrapper(self, data, groupby, orient, scales):
+        params = [getattr(self, f.name) for f in dataclasses.fields(self)]
+        key = None
+        if _cache is not None:
+            key = hash_key(
+                type(self).__qualname__,
+                *params,
+                sorted(groupby.order.items()),
+                orient,
+                data,
+            )
+        return memoize(key, lambda: call(self, data, groupby, orient, scales))
+
+    return wrapper
@@ -0,0 +1,92 @@
+"""
+Data sources that are read in chunks, for plots of datasets that do not fit
+in memory.
+"""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator, Mapping
+
+import pandas as pd
+
+from .stats.aggregation import aggregate_chunks
+
+
+class Chunks:
+    """
+    A data source read one DataFrame at a time.
+
+    When a :class:`Plot` receives a chunked source, it is streamed once and
+    reduced to partial aggregates of the `x` and `y` variables for each
+    combination of the other variables, which :class:`Agg2d` merges. Memory
+    use is bounded by the chunk size and the number of distinct keys.
+
+    Parameters
+    ----------
+    source : str, path or iterable of DataFrames
+        A CSV or Parquet file, or an iterable of DataFrames (e.g., a
+        generator). Parquet files require `pyarrow`.
+    chunksize : int
+        Number of rows read at a time from files.
+    keys : list of str
+        Columns kept in addition to the plot variables, e.g. for faceting.
+    sketch : int
+        Capacity of the quantile sketches kept for each combination of keys,
+        which :class:`ApproxQuantile` reducers need. Default is None (no
+        sketches).
+
+    """
+
+    def __init__(
+        self,
+        source: str | os.PathLike | Iterable[pd.DataFrame],
+        chunksize: int = 1_000_000,
+        keys: list[str] | None = None,
+        sketch: int | None = None,
+    ):
+        self.source = source
+        self.chunksize = chunksize
+        self.keys = [] if keys is None else list(keys)
+        self.sketch = sketch
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        if not isinstance(self.source, (str, os.PathLike)):
+            yield from self.source
+            return
+
+        path = os.fspath(self.source)
+        if path.endswith((".parquet", ".pq")):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as err:
+                raise ImportError("Reading Parquet files requires pyarrow.") from err
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=self.chunksize):
+                yield batch.to_pandas()
+        else:
+            with pd.read_csv(path, chunksize=self.chunksize) as reader:
+                yield from reader
+
+
+def is_chunked(data) -> bool:
+    """Return whether `data` is a source that should be read in chunks."""
+    if isinstance(data, (Chunks, str, os.PathLike, Iterator)):
+        return True
+    if isinstance(data, (pd.DataFrame, Mapping)) or hasattr(data, "__dataframe__"):
+        return False
+    return isinstance(data, Iterable)
+
+
+def summarize(data, variables: dict) -> pd.DataFrame:
+    """
+    Stream a chunked source and reduce it to partial aggregates of the `x`
+    and `y` variables for each combination of the other variables.
+    """
+    chunks = data if isinstance(data, Chunks) else Chunks(data)
+    names = [variables.get("x"), variables.get("y")]
+    names += [v for k, v in variables.items() if k not in ["x", "y"]]
+    if not all(isinstance(name, str) for name in names):
+        raise ValueError("Variables of chunked data must be column names.")
+
+    x, y, *keys = names
+    keys = list(dict.fromkeys(keys + chunks.keys))
+    return aggregate_chunks(chunks, x, y, keys, chunks.sketch)
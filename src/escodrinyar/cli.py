@@ -0,0 +1,93 @@
+"""
+Command line interface, which renders layout specs to image files.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Render the layout specs given on the command line.
+
+    Each spec is written to the files in its `output` entry, or to a file
+    named after the spec in the format given by `--format`. Specs are
+    rendered by worker processes with `--jobs`, each reading its own data.
+    Specs that fail are reported and the others are still rendered.
+
+    Returns
+    -------
+    int
+        The exit status, 1 if any spec failed.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="escodrinyar",
+        description="Render layout specs (JSON or YAML) to image files.",
+    )
+    parser.add_argument("specs", nargs="+", metavar="SPEC", help="spec files")
+    parser.add_argument(
+        "-o", "--output-dir",
+        help="directory of the files, instead of that of each spec",
+    )
+    parser.add_argument(
+        "-f", "--format", default="png",
+        help="format of specs without outputs (default: png)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="number of worker processes, -1 for all CPUs (default: 1)",
+    )
+    parser.add_argument("--dpi", type=float, help="resolution of raster files")
+    args = parser.parse_args(argv)
+
+    kwargs = {} if args.dpi is None else {"dpi": args.dpi}
+    tasks = [(spec, args.output_dir, args.format, kwargs) for spec in args.specs]
+
+    if args.jobs == 1:
+        results = [_run(*task) for task in tasks]
+    else:
+        max_workers = os.cpu_count() if args.jobs == -1 else args.jobs
+        with ProcessPoolExecutor(max_workers) as pool:
+            results = [pool.submit(_run, *task) for task in tasks]
+            results = [future.result() for future in results]
+
+    failed = 0
+    for spec, (paths, error) in zip(args.specs, results):
+        if error is None:
+            for path in paths:
+                print(path)
+        else:
+            failed += 1
+            print(f"{spec}: {error}", file=sys.stderr)
+    return int(failed > 0)
+
+
+def _run(path, output_dir, fmt, kwargs):
+    """Render the spec in `path`, and return the written paths or the error."""
+    try:
+        return _render(path, output_dir, fmt, kwargs), None
+    except Exception as err:
+        return [], f"{type(err).__name__}: {err}"
+
+
+def _render(path, output_dir, fmt, kwargs):
+    from . import spec
+    from ._export import export
+
+    base = os.path.dirname(path)
+    config = spec.load(path)
+    layout = spec.build(config, base)
+
+    targets = spec.outputs(config, base)
+    if not targets:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        targets = [os.path.join(base, f"{stem}.{fmt}")]
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        targets = [os.path.join(output_dir, os.path.basename(t)) for t in targets]
+
+    return export([(layout, targets)], **kwargs)
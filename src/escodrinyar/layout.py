@@ -1,6 +1,13 @@
-import matplotlib.pyplot as plt
 import matplotlib as mpl
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import numpy as np
+import copy
 import io
+import re
+import os
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from .utils import sowraps
 from functools import wraps
 from seaborn.objects import Plot as SeabornPlot
@@ -10,21 +17,57 @@ from seaborn._core.typing import (
     VariableSpecList,
     OrderSpec,
 )
-from seaborn._core.scales import Scale
+from seaborn._core.data import PlotData
+from seaborn._core.plot import Plotter, theme_context
+from seaborn._core.properties import PROPERTIES
+from seaborn._core.rules import categorical_order
+from seaborn._core.scales import Continuous, Nominal, Scale
 from seaborn.objects import Mark, Stat, Move
 from typing import Any, Callable
-import base64
+import pandas as pd
+from . import profile
+from .cache import hash_key
+from .chunks import is_chunked, summarize
+from .stats.aggregation import Agg2d, has_partials, partial_columns, sketch_column
 
 
 class Layout:
     """
     An interface for declaratively specifying the layout for multiple plots.
+
+    The display in notebooks is configured with the `display` class
+    attribute, a dictionary with the `format` ("png", "svg" or "jpeg"), the
+    `dpi` (default is the figure dpi), the maximum number of pixels of PNG and
+    JPEG images, `max_pixels`, and the JPEG `quality`.
+
+    Legends show all the levels by default. They are bounded with the `legend`
+    class attribute: with a `max_entries`, a legend with more levels shows
+    the first ones and an entry for the others when `overflow` is "other",
+    or a single entry with the colors of all the levels when it is "summary".
     """
 
+    display: dict = {
+        "format": "png", "dpi": None, "max_pixels": 4_000_000, "quality": 85
+    }
+    legend: dict = {"max_entries": None, "overflow": "other"}
+
     def __init__(self, layout):
         self.layout: list[list] = layout
         _ = self.opts()
         self.fig: mpl.figure.Figure | None = None
+        # What is drawn in `fig`, to only redraw the cells that change
+        self._rendered: dict = {}
+        # Last image displayed in each format, with the state it shows
+        self._display: dict = {}
+        # Default scales of data columns, shared by the cells that map them
+        self._prepared: dict = {}
+
+    def __getstate__(self):
+        # Figures cannot be pickled, so layouts are sent to other processes
+        # without what they rendered
+        state = self.__dict__.copy()
+        state.update(fig=None, _rendered={}, _display={}, _prepared={})
+        return state
 
     def __add__(self, other):
         """
@@ -76,71 +119,304 @@ class Layout:
 
     @sowraps(SeabornPlot.show)
     def show(self, **kwargs):
-        if self.fig is None or self.fig.__class__ == mpl.figure.Figure:
-            plt.close(self.fig)
-            self.plot(pyplot=True)
-        plt.show(**kwargs)
+        self.plot(pyplot=True)
+        _pyplot().show(**kwargs)
 
     @sowraps(SeabornPlot.save)
     def save(self, loc, **kwargs):
-        if self.fig is None:
-            _ = self.plot()
-        self.fig.savefig(loc, **kwargs)
+        # Only the cells that changed since the last call are redrawn
+        _ = self._plot_for(loc, kwargs)
+        _savefig(self.fig, loc, **kwargs)
         # plt.close(fig)
 
     @sowraps(SeabornPlot.plot)
     def plot(self, pyplot=False):
-        if self.fig is not None:
-            plt.close(self.fig)
+        return self._plot_for(None, {}, pyplot)
+
+    def _plot_for(self, loc, kwargs, pyplot=False):
+        """Plot the figure to be saved to `loc` with the savefig `kwargs`."""
+        with profile.span("plot", "layout", n_jobs=self.n_jobs):
+            # Parallel renderings are images at the output resolution, which
+            # vector formats and tight bounding boxes cannot use
+            if self.n_jobs in (None, 1) or not _is_raster_output(loc, kwargs):
+                self._update_figure(pyplot)
+            else:
+                self._update_figure_parallel(pyplot, _output_dpi(kwargs))
+        return self
 
-        nrows = len(self.layout)
-        ncols = -1
-        for row in self.layout:
-            if ncols < len(row):
-                ncols = len(row)
+    def _grid_key(self):
+        return (
+            tuple(len(row) for row in self.layout),
+            None if self.width_ratios is None else tuple(self.width_ratios),
+            None if self.height_ratios is None else tuple(self.height_ratios),
+        )
 
-        # create a gridspec
+    def _cells(self):
+        """Yield the position, gridspec slot and plot of each cell."""
+        ncols = max(len(row) for row in self.layout)
+        for i, row in enumerate(self.layout):
+            plot_ncols = ncols // len(row)
+            for j, plot in enumerate(row):
+                yield (i, j), (i, j * plot_ncols, (j + 1) * plot_ncols), plot
+
+    def _new_figure(self, pyplot=False, dpi=None):
         if pyplot is False:
-            fig = mpl.figure.Figure(constrained_layout=True, figsize=self.figsize)
+            fig = mpl.figure.Figure(
+                constrained_layout=True, figsize=self.figsize, dpi=dpi
+            )
         else:
-            fig = plt.figure(constrained_layout=True, figsize=self.figsize)
+            fig = _pyplot().figure(
+                constrained_layout=True, figsize=self.figsize, dpi=dpi
+            )
 
+        # create a gridspec
         gs = fig.add_gridspec(
-            nrows,
-            ncols,
+            len(self.layout),
+            max(len(row) for row in self.layout),
             width_ratios=self.width_ratios,
             height_ratios=self.height_ratios,
         )
+        return fig, gs
 
-        for i, row in enumerate(self.layout):
-            plot_ncols = ncols // len(row)
-            for j, plot in enumerate(row):
-                sfig = fig.add_subfigure(
-                    gs[i, j * plot_ncols : (j + 1) * plot_ncols]
-                )
-                with mpl.rc_context(plot.rc_params):
-                    plot_j = plot.splot.on(sfig).plot()
-                    legend_j = plot_j._legend_contents
-                    make_legend(sfig, legend_j)
+    def _reusable(self, fig, pyplot):
+        if fig is None or self._rendered.get("grid") != self._grid_key():
+            return False
+        # A figure closed by pyplot cannot be shown again
+        return not pyplot or _pyplot().fignum_exists(getattr(fig, "number", None))
+
+    def _update_figure(self, pyplot=False):
+        # Subfigures of cells whose fingerprint did not change are kept
+        fig = self.fig
+        if not self._reusable(fig, pyplot) or "subfigures" not in self._rendered:
+            _close(fig)
+            fig, gs = self._new_figure(pyplot)
+            self._rendered = {"grid": self._grid_key(), "gridspec": gs, "subfigures": {}}
+        fig.set_size_inches(self.figsize)
 
-        fig.legends = []
+        gs = self._rendered["gridspec"]
+        subfigures = self._rendered["subfigures"]
+        prepared, self._prepared = self._prepared, {}
+        frames = {}
+        for cell, (i, start, stop), plot in self._cells():
+            with profile.span("cell", "cell", cell=cell) as event:
+                key = _fingerprint(plot, (i, start, stop), frames)
+                if cell in subfigures:
+                    old_key, sfig = subfigures.pop(cell)
+                    if key is not None and key == old_key:
+                        subfigures[cell] = old_key, sfig
+                        event["reused"] = True
+                        continue
+                    _remove_subfigure(sfig)
+                sfig = fig.add_subfigure(gs[i, start:stop])
+                _plot_cell(plot, sfig, *self._prepare(plot, frames, prepared))
+                subfigures[cell] = key, sfig
 
         self.fig = fig
-        return self
+
+    def _prepare(self, plot, frames, prepared=None):
+        """
+        Return the default scales of the variables that `plot` maps to columns
+        of its data, the levels of its facets, and its grouping keys, which
+        are inferred once for all the cells with the same data frame content.
+
+        Grouping keys are the string columns of plots with several layers,
+        factorized into categoricals, so that each layer does not find their
+        levels again. Data frames are hashed once for all the cells prepared
+        with the same `frames`, as in :func:`_fingerprint`.
+        """
+        spec = plot.splot
+        source = spec._data.source_data
+        if not isinstance(source, pd.DataFrame) or spec._pair_spec:
+            return {}, {}, {}
+        content = _frame_hash(source, frames)
+        if content is None:
+            return {}, {}, {}
+        prepared = self._prepared if prepared is None else prepared
+
+        def fit(col, var):
+            key = content, col, var
+            if key in prepared:
+                self._prepared[key] = prepared[key]
+            elif key not in self._prepared:
+                if var in ["col", "row"]:
+                    value = categorical_order(source[col])
+                elif var == "key":
+                    value = _factorize(source[col])
+                else:
+                    value = _default_scale(var, source[col])
+                self._prepared[key] = value
+            return self._prepared[key]
+
+        structure = {}
+        for dim, col in spec._facet_spec.get("variables", {}).items():
+            if dim not in spec._facet_spec["structure"] and _is_column(col, source):
+                structure[dim] = fit(col, dim)
+
+        keys = {}
+        if len(spec._layers) > 1:
+            for var, col in spec._data.source_vars.items():
+                if re.fullmatch(r"[xy]\d*", var) is None and _is_column(col, source):
+                    key = fit(col, "key")
+                    if key is not None:
+                        keys[var] = key
+
+        # Layers with their own data, variables or stat-filled properties
+        # would not be scaled from the common data alone
+        overridden = set()
+        for layer in spec._layers:
+            if layer["source"] is not None:
+                return {}, structure, keys
+            overridden.update(layer["vars"])
+            overridden.add(getattr(layer["stat"], "prop", None))
+
+        scales = {}
+        for var, col in spec._data.source_vars.items():
+            if (
+                var in spec._scales
+                or var in overridden
+                or var not in PROPERTIES
+                or not _is_column(col, source)
+            ):
+                continue
+            scale = fit(col, var)
+            if scale is not None:
+                # Seaborn sets attributes on the scales it is given
+                scales[var] = copy.copy(scale)
+        return scales, structure, keys
+
+    def _make_figure(self, cells=(), dpi=None, frames=None):
+        """
+        Build the figure, plotting only the given `cells`, with the data
+        frames hashed in `frames`.
+        """
+        fig, gs = self._new_figure(dpi=dpi)
+        frames = {} if frames is None else frames
+        subfigures = {}
+        for cell, (i, start, stop), plot in self._cells():
+            sfig = fig.add_subfigure(gs[i, start:stop])
+            subfigures[cell] = sfig
+            if cell in cells:
+                _plot_cell(plot, sfig, *self._prepare(plot, frames))
+
+        return fig, subfigures
+
+    def _update_figure_parallel(self, pyplot=False, dpi=None):
+        # Each worker lays out the whole grid, so that the slot of its cell is
+        # the same as in the sequential figure, but only plots and draws that
+        # cell at the output `dpi`; the parent pastes the pixels of each slot,
+        # and those drawn outside of it (e.g., overhanging legends), into one
+        # image, in the order of the cells. Pixels of cells whose fingerprint
+        # did not change are kept.
+        dpi = mpl.rcParams["figure.dpi"] if dpi is None else dpi
+        grid = self._grid_key(), tuple(self.figsize), dpi
+        blocks = self._rendered.get("blocks", {})
+        if self._rendered.get("raster") != grid:
+            blocks = {}
+
+        frames = {}
+        keys = {
+            cell: _fingerprint(plot, slot, frames) for cell, slot, plot in self._cells()
+        }
+        todo = [
+            cell for cell, key in keys.items()
+            if key is None or blocks.get(cell, (None,))[0] != key
+        ]
+        if not todo and set(blocks) == set(keys) and self._reusable(self.fig, pyplot):
+            return
+
+        if todo:
+            max_workers = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+            max_workers = min(max_workers, len(todo))
+            with profile.span("workers", "cell", cells=len(todo)), ProcessPoolExecutor(
+                max_workers,
+                initializer=_init_render_worker,
+                initargs=(
+                    Layout(self.layout).opts(
+                        self.figsize, self.width_ratios, self.height_ratios
+                    ),
+                    dict(mpl.rcParams),
+                    dict(SeabornPlot.config.theme),
+                    dict(Layout.legend),
+                ),
+            ) as pool:
+                results = pool.map(_render_cell, todo, [dpi] * len(todo))
+                for cell, block in zip(todo, results):
+                    blocks[cell] = keys[cell], block
+        blocks = {cell: blocks[cell] for cell in keys}
+
+        with profile.span("composite", "draw"):
+            background, _ = self._make_figure(dpi=dpi)
+            image = _draw_rgba(background).copy()
+            _close(background)
+            for _, (rows, cols, block, mask) in blocks.values():
+                image[rows, cols][mask] = block[mask]
+
+        _close(self.fig)
+        if pyplot is False:
+            fig = mpl.figure.Figure(figsize=self.figsize, dpi=dpi)
+        else:
+            fig = _pyplot().figure(figsize=self.figsize, dpi=dpi)
+        fig.figimage(image, resize=False)
+        self._rendered = {"grid": self._grid_key(), "raster": grid, "blocks": blocks}
+        self.fig = fig
 
     def _repr_png_(self):
-        if self.fig is None:
-            _ = self.plot()
+        return self._repr_image("png")
+
+    def _repr_jpeg_(self):
+        return self._repr_image("jpeg")
+
+    def _repr_svg_(self):
+        image = self._repr_image("svg")
+        return None if image is None else image.decode()
+
+    def _repr_image(self, fmt):
+        options = dict(Layout.display)
+        if options["format"] != fmt:
+            return None
+
+        kwargs = {"format": fmt, "dpi": self._display_dpi(options)}
+        if fmt == "jpeg":
+            kwargs["pil_kwargs"] = {"quality": options["quality"]}
+        # Only the cells that changed since the last display are redrawn, and
+        # the image is only saved again if any of them did
+        _ = self._plot_for(None, kwargs)
+        key = self._display_key(options)
+        cached = self._display.get(fmt)
+        if key is not None and cached is not None and cached[0] == key:
+            return cached[1]
+
         buffer = io.BytesIO()
-        self.fig.savefig(buffer, format="png")
-        buffer.seek(0)
+        _savefig(self.fig, buffer, **kwargs)
         image = buffer.getvalue()
-        buffer.close()
-        graphic = base64.b64encode(image).decode("utf-8")
-        # plt.close(fig)
-        return graphic
+        self._display[fmt] = key, image
+        return image
 
-    def opts(self, figsize=(5, 5), width_ratios=None, height_ratios=None):
+    def _display_key(self, options):
+        # Cells are keyed by the fingerprints computed when plotting them
+        cells = self._rendered.get("subfigures", self._rendered.get("blocks", {}))
+        keys = [cells[cell][0] for cell in sorted(cells)]
+        if None in keys:
+            return None
+        return hash_key(
+            keys,
+            self._rendered["grid"],
+            self._rendered.get("raster"),
+            tuple(self.figsize),
+            mpl.rcParams["figure.dpi"],
+            options,
+        )
+
+    def _display_dpi(self, options):
+        dpi = options["dpi"] or mpl.rcParams["figure.dpi"]
+        if options["max_pixels"]:
+            width, height = self.figsize
+            dpi = min(dpi, (options["max_pixels"] / (width * height)) ** 0.5)
+        return dpi
+
+    def opts(
+        self, figsize=(5, 5), width_ratios=None, height_ratios=None, n_jobs=None
+    ):
         """
         Set the layout options for the plots.
 
@@ -152,6 +428,14 @@ class Layout:
             The relative widths of the columns. Default is None.
         height_ratios:
             The relative heights of the rows. Default is None.
+        n_jobs: int
+            Number of worker processes that render the plots in parallel (-1
+            uses all CPUs). Each plot is rasterized at the output dpi,
+            including what it draws outside of its slot (e.g., legends),
+            and the figure holds the resulting image. Where plots overlap,
+            antialiased edges may differ slightly from the sequential
+            rendering. Saving to vector formats, or with a tight bounding
+            box, renders sequentially. Default is None (sequential).
 
         Returns
         -------
@@ -161,6 +445,7 @@ class Layout:
         self.figsize = figsize
         self.width_ratios = width_ratios
         self.height_ratios = height_ratios
+        self.n_jobs = n_jobs
 
         return self
 
@@ -178,9 +463,17 @@ class Plot:
         **variables: VariableSpec,
     ):
         if splot is None:
+            if is_chunked(data):
+                # Only aggregates of chunked data are kept in memory
+                data = summarize(data, variables)
             splot = SeabornPlot(*args, data=data, **variables)
         self.splot = splot
         self.rc_params = {}
+        # Kept to reuse its figure and image across displays
+        self._layout: Layout | None = None
+
+    def __getstate__(self):
+        return {**self.__dict__, "_layout": None}
 
     def __add__(self, other):
         if isinstance(other, Plot):
@@ -196,9 +489,8 @@ class Plot:
 
     def __mul__(self, other):
         if isinstance(other, Plot):
-            # TODO: check that the plots have the same data and variables
             splot = self.splot._clone()
-            splot._layers.extend(other.splot._layers)
+            splot._layers.extend(_shared_layers(self.splot._data, other.splot))
             self.rc_params = {**self.rc_params, **other.rc_params}
             plot = Plot(splot.theme(self.rc_params))
             plot.rc_params = self.rc_params
@@ -207,7 +499,18 @@ class Plot:
             raise ValueError("Can only multiply Plot by Plot")
 
     def _repr_png_(self):
-        return Layout([[self]])._repr_png_()
+        return self._display_layout()._repr_png_()
+
+    def _repr_jpeg_(self):
+        return self._display_layout()._repr_jpeg_()
+
+    def _repr_svg_(self):
+        return self._display_layout()._repr_svg_()
+
+    def _display_layout(self):
+        if self._layout is None:
+            self._layout = Layout([[self]])
+        return self._layout
 
     @sowraps(SeabornPlot.add)
     def add(
@@ -220,6 +523,26 @@ class Plot:
         data: DataSource = None,
         **variables: VariableSpec,
     ):
+        # Properties filled by a Stat (e.g. Bin2d) have no variable name that
+        # seaborn could use to title their legend
+        for transform in transforms:
+            prop = getattr(transform, "prop", None)
+            if prop is not None and prop not in {**self.splot._data.names, **variables}:
+                legend = False
+
+        # Agg2d merges the partial aggregates of chunked data, but not user
+        # columns that happen to have the same names
+        source = self.splot._data.source_data
+        if (
+            data is None
+            and has_partials(source)
+            and any(isinstance(t, Agg2d) for t in transforms)
+        ):
+            for var in ["x", "y"]:
+                for col in [*partial_columns(var).values(), sketch_column(var)]:
+                    if col in source:
+                        variables.setdefault(col, col)
+
         plot = Plot(
             self.splot.add(
                 mark,
@@ -240,6 +563,12 @@ class Plot:
         plot.rc_params = self.rc_params
         return plot
 
+    @sowraps(SeabornPlot.limit)
+    def limit(self, **limits: tuple[Any, Any]):
+        plot = Plot(self.splot.limit(**limits))
+        plot.rc_params = self.rc_params
+        return plot
+
     @sowraps(SeabornPlot.theme)
     def theme(self, config: dict[str, Any]):
         plot = Plot(self.splot.theme(self.rc_params))
@@ -288,18 +617,387 @@ class Plot:
 
     @sowraps(SeabornPlot.show)
     def show(self):
-        return Layout([[self]]).show()
+        # The layout is reused, so that its previous figure is closed
+        return self._display_layout().show()
 
     @sowraps(SeabornPlot.save)
     def save(self, loc, **kwargs):
-        return Layout([[self]]).save(loc, **kwargs)
+        return self._display_layout().save(loc, **kwargs)
 
     @wraps(Layout.opts)
-    def opts(self, figsize=(5, 5), width_ratios=None, height_ratios=None):
-        return Layout([[self]]).opts(figsize, width_ratios, height_ratios)
+    def opts(
+        self, figsize=(5, 5), width_ratios=None, height_ratios=None, n_jobs=None
+    ):
+        return Layout([[self]]).opts(figsize, width_ratios, height_ratios, n_jobs)
+
+
+def _same_data(a, b):
+    if a is b:
+        return True
+    if not (isinstance(a, pd.DataFrame) and isinstance(b, pd.DataFrame)):
+        return False
+    if a.shape != b.shape or not a.columns.equals(b.columns):
+        return False
+    # Values are compared, as factorized columns are categoricals
+    return all(
+        _values(a.iloc[:, i]).equals(_values(b.iloc[:, i])) for i in range(a.shape[1])
+    )
+
+
+def _values(col):
+    return col.astype(object) if isinstance(col.dtype, pd.CategoricalDtype) else col
+
+
+def _same_vars(a, b):
+    return a.keys() == b.keys() and all(
+        a[k] is b[k] or (isinstance(a[k], str) and a[k] == b[k]) for k in a
+    )
+
+
+def _shared_layers(common, splot):
+    """
+    Return the layers of `splot`, joined with `common` data instead of their
+    own common data.
+
+    Layers with the same data and variables are kept as they are, so that
+    seaborn materializes their columns once.
+    """
+    own = splot._data
+    same_data = _same_data(own.source_data, common.source_data)
+    if same_data and _same_vars(own.source_vars, common.source_vars):
+        return splot._layers
+
+    layers = []
+    for layer in splot._layers:
+        layer = dict(layer)
+        if layer["source"] is None:
+            if not same_data:
+                layer["source"] = own.source_data
+            variables = {**own.source_vars, **layer["vars"]}
+        else:
+            # Layers with their own data join the common vectors of `splot`
+            # by index, as seaborn does, instead of looking up their names
+            variables = {
+                k: own.frame[k]
+                for k in own.source_vars
+                if k in own.frame and k not in layer["vars"]
+            }
+            variables.update(layer["vars"])
+        # Variables of the common data that `splot` does not have are dropped
+        variables.update({k: None for k in common.source_vars if k not in variables})
+        layer["vars"] = variables
+        layers.append(layer)
+    return layers
+
 
+def _factorize(values):
+    """
+    Return string `values` as a categorical series, or None if they are not
+    strings.
+    """
+    if pd.api.types.infer_dtype(values, skipna=True) != "string":
+        return None
+    # Categories in order of appearance, as seaborn orders strings
+    categories = values.dropna().unique()
+    return pd.Series(
+        pd.Categorical(values, categories=categories),
+        index=values.index,
+        name=values.name,
+    )
+
+
+def _default_scale(var, values):
+    """
+    Return the scale that seaborn would infer for `values`, or None if it
+    may not be the same for every cell.
+    """
+    scale = PROPERTIES[var].default_scale(values)
+    if type(scale) is Nominal and scale.order is None:
+        if var in ["x", "y"]:
+            # Derived coordinates, such as xmin, use the same scale
+            return None
+        # Levels are found once and given to each cell
+        return Nominal(order=categorical_order(values))
+    if var in ["x", "y"] and type(scale) is not Continuous:
+        return None
+    return scale
+
+
+def _is_column(col, source):
+    return isinstance(col, str) and col in source
+
+
+def _plot_cell(plot, sfig, scales=None, structure=None, keys=None):
+    with mpl.rc_context(plot.rc_params):
+        splot = plot.splot.on(sfig)
+        if scales:
+            splot._scales = {**scales, **splot._scales}
+        if keys:
+            # Layers use the keys of the common data unless they bring their
+            # own data or variables
+            data = splot._data
+            splot._data = PlotData(data.source_data, {**data.source_vars, **keys})
+        # Seaborn adds the facet levels to the structure, which the clone
+        # shares with the spec, whose fingerprint would then change
+        facet_spec = splot._facet_spec
+        if structure or "structure" in facet_spec:
+            structure = {**facet_spec.get("structure", {}), **(structure or {})}
+            splot._facet_spec = {**facet_spec, "structure": structure}
+        plot_j = _compile(splot)
+        legend_j = plot_j._legend_contents
+        with profile.span("legend", "legend"):
+            make_legend(sfig, legend_j, **Layout.legend)
+
+
+def _compile(splot):
+    """
+    Compile `splot` as :meth:`seaborn.objects.Plot.plot` does, through a
+    :class:`_CellPlotter`, except for the figure legend, which each cell makes
+    from the legend contents instead.
+    """
+    theme = splot._theme_with_defaults()
+    with theme_context(theme):
+        plotter = _CellPlotter(pyplot=False, theme=theme)
+        common, layers = plotter._extract_data(splot)
+        plotter._setup_figure(splot, common, layers)
+        coord_vars = [v for v in splot._variables if re.match(r"^x|y", v)]
+        plotter._setup_scales(splot, common, layers, coord_vars)
+        plotter._compute_stats(splot, layers)
+        plotter._setup_scales(splot, common, layers)
+        plotter._data = common
+        plotter._layers = layers
+        for layer in layers:
+            plotter._plot_layer(splot, layer)
+        plotter._finalize_figure(splot)
+    return plotter
+
+
+class _CellPlotter(Plotter):
+    """A seaborn plotter that times each step of the compilation."""
+
+    def _extract_data(self, p):
+        with profile.span("data", "data"):
+            return super()._extract_data(p)
+
+    def _setup_figure(self, p, common, layers):
+        with profile.span("figure", "figure"):
+            super()._setup_figure(p, common, layers)
+
+    def _setup_scales(self, p, common, layers, variables=None):
+        if variables is not None:
+            with profile.span("coordinate scales", "scales"):
+                super()._setup_scales(p, common, layers, variables)
+            return
+        with profile.span("scales", "scales"):
+            super()._setup_scales(p, common, layers)
+        _set_limits(self, p)
+
+    def _compute_stats(self, spec, layers):
+        # Layers are independent, so that each stat can be timed alone
+        for i, layer in enumerate(layers):
+            if layer["stat"] is not None:
+                name = type(layer["stat"]).__name__
+                with profile.span("stat", "stat", layer=i, target=name):
+                    super()._compute_stats(spec, [layer])
+
+    def _plot_layer(self, p, layer):
+        i = next(i for i, other in enumerate(self._layers) if other is layer)
+        name = type(layer["mark"]).__name__
+        with profile.span("mark", "mark", layer=i, target=name):
+            super()._plot_layer(p, layer)
+
+    def _finalize_figure(self, p):
+        with profile.span("finalize", "figure"):
+            super()._finalize_figure(p)
+
+
+def _set_limits(plotter, splot):
+    """
+    Set the axis limits given for both ends before plotting the layers, as
+    :meth:`Plotter._finalize_figure` does after, so that marks can skip what
+    lies outside of them.
+    """
+    for sub in plotter._subplots:
+        ax = sub["ax"]
+        for axis in "xy":
+            limits = splot._limits.get(sub[axis]) or splot._limits.get(axis)
+            if limits is None or None in limits:
+                continue
+            convert_units = getattr(ax, f"{axis}axis").convert_units
+            a, b = limits
+            lo, hi = convert_units(a), convert_units(b)
+            if isinstance(a, str):
+                lo = lo - 0.5
+            if isinstance(b, str):
+                hi = hi + 0.5
+            ax.set(**{f"{axis}lim": (lo, hi)})
+
+
+def _savefig(fig, loc, **kwargs):
+    """Save `fig`, timing its layout apart from the rest of the drawing."""
+    if not profile.is_recording():
+        fig.savefig(loc, **kwargs)
+        return
+
+    fmt = kwargs.get("format")
+    if fmt is None and isinstance(loc, (str, os.PathLike)):
+        fmt = os.path.splitext(loc)[1][1:]
+    engine = fig.get_layout_engine()
+    with profile.span("savefig", "draw", format=fmt):
+        if engine is None:
+            fig.savefig(loc, **kwargs)
+            return
+
+        execute = engine.execute
+
+        def timed_execute(fig):
+            with profile.span("layout", "draw", target=type(engine).__name__):
+                return execute(fig)
+
+        engine.execute = timed_execute
+        try:
+            fig.savefig(loc, **kwargs)
+        finally:
+            del engine.execute
+
+
+def _remove_subfigure(sfig):
+    # Axes of subfigures are also registered in the root figure
+    for ax in sfig.axes:
+        ax.remove()
+    sfig.remove()
+
+
+def _fingerprint(plot, slot, frames=None):
+    """
+    Hash everything that determines how `plot` is drawn in `slot`, including
+    the global matplotlib settings.
+
+    Data frames are hashed once for all the plots fingerprinted with the same
+    `frames`, which maps their ids to a weak reference and their hash.
+    """
+    spec = plot.splot
+    data = spec._data.source_data
+    if isinstance(data, pd.DataFrame) and frames is not None:
+        data = _frame_hash(data, frames)
+        if data is None:
+            return None
+    return hash_key(
+        data,
+        spec._data.source_vars,
+        spec._layers,
+        spec._scales,
+        spec._shares,
+        spec._limits,
+        spec._labels,
+        spec._theme,
+        spec._facet_spec,
+        spec._pair_spec,
+        spec._figure_spec,
+        spec._subplot_spec,
+        spec._layout_spec,
+        dict(mpl.rcParams),
+        dict(SeabornPlot.config.theme),
+        plot.rc_params,
+        dict(Layout.legend),
+        slot,
+    )
+
+
+def _frame_hash(data, frames):
+    """
+    Return the content hash of the data frame `data`, computed once for all
+    the calls with the same `frames`, which maps ids of data frames to a weak
+    reference and their hash.
+    """
+    if id(data) not in frames or frames[id(data)][0]() is not data:
+        frames[id(data)] = weakref.ref(data), hash_key(data)
+    return frames[id(data)][1]
+
+
+_render_layout = None
+# Hashes of the data frames of the layout of a worker
+_render_frames = {}
+# Images of the empty grid drawn by a worker, by dpi
+_render_backgrounds = {}
+_RASTER_FORMATS = ["png", "jpg", "jpeg", "tif", "tiff", "webp", "raw", "rgba"]
+
+
+def _init_render_worker(layout, rc_params, theme, legend):
+    global _render_layout
+    _render_layout = layout
+    mpl.rcParams.update(rc_params)
+    SeabornPlot.config.theme.update(theme)
+    Layout.legend = legend
+
+
+def _render_cell(cell, dpi):
+    """
+    Draw `cell` alone, and return the bounding rows and columns of its slot
+    and of the pixels it changed elsewhere, with those pixels and their mask.
+    """
+    if dpi not in _render_backgrounds:
+        background, _ = _render_layout._make_figure(dpi=dpi)
+        _render_backgrounds[dpi] = _draw_rgba(background).copy()
+        _close(background)
+    background = _render_backgrounds[dpi]
+
+    fig, subfigures = _render_layout._make_figure([cell], dpi, _render_frames)
+    image = _draw_rgba(fig)
+    mask = (image != background).any(axis=-1)
+    x0, y0, x1, y1 = np.round(subfigures[cell].bbox.extents).astype(int)
+    height = image.shape[0]
+    # Later slots cover what earlier cells drew in them, as in the sequential
+    # figure, where each subfigure draws its background over the previous ones
+    mask[height - y1:height - y0, x0:x1] = True
+    rows, = np.nonzero(mask.any(axis=1))
+    cols, = np.nonzero(mask.any(axis=0))
+    rows = slice(rows[0], rows[-1] + 1)
+    cols = slice(cols[0], cols[-1] + 1)
+    block = image[rows, cols].copy()
+    _close(fig)
+    return rows, cols, block, mask[rows, cols]
+
+
+def _is_raster_output(loc, kwargs):
+    """Return whether saving to `loc` with `kwargs` writes a whole raster image."""
+    fmt = kwargs.get("format")
+    if fmt is None and isinstance(loc, (str, os.PathLike)):
+        fmt = os.path.splitext(loc)[1][1:] or None
+    if fmt is None:
+        fmt = mpl.rcParams["savefig.format"]
+    bbox_inches = kwargs.get("bbox_inches", mpl.rcParams["savefig.bbox"])
+    return fmt.lower() in _RASTER_FORMATS and bbox_inches != "tight"
+
+
+def _output_dpi(kwargs):
+    dpi = kwargs.get("dpi", mpl.rcParams["savefig.dpi"])
+    return mpl.rcParams["figure.dpi"] if dpi in (None, "figure") else dpi
+
+
+def _pyplot():
+    # Imported on first use, as only figures that are shown need it
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _close(fig):
+    """Close `fig` in pyplot, which can only know it if it is imported."""
+    if fig is not None and "matplotlib.pyplot" in sys.modules:
+        sys.modules["matplotlib.pyplot"].close(fig)
+
+
+def _draw_rgba(fig):
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())
+
+
+def make_legend(sfig, legend_contents, max_entries=None, overflow="other"):
+    if max_entries is not None and max_entries < 1:
+        raise ValueError(f"`max_entries` must be at least 1, not {max_entries!r}.")
 
-def make_legend(sfig, legend_contents):
     merged_contents = {}
     for key, new_artists, labels in legend_contents:
         # Key is (name, id); we need the id to resolve variable uniqueness,
@@ -321,22 +1019,61 @@ def make_legend(sfig, legend_contents):
     # get last axes
     ax = sfig.get_axes()[-1]
 
-    base_legend = None
+    # Sections after the first are headed by an entry with their name, so
+    # that a single legend is built for all of them
+    title, entries, handler_map = None, ([], []), {}
     for (name, _), (handles, labels) in merged_contents.items():
+        if max_entries is not None and len(handles) > max_entries:
+            handles, labels, strips = _bound_entries(
+                handles, labels, max_entries, overflow
+            )
+            handler_map.update(strips)
+        if title is None:
+            title = name
+        else:
+            entries[0].append(mpl.patches.Rectangle((0, 0), 0, 0, visible=False))
+            entries[1].append(name)
+        entries[0].extend(handles)
+        entries[1].extend(labels)
+
+    if title is not None:
         legend = mpl.legend.Legend(
             ax,
-            handles,  # type: ignore  # matplotlib/issues/26639
-            labels,
-            title=name,
+            entries[0],  # type: ignore  # matplotlib/issues/26639
+            entries[1],
+            title=title,
+            handler_map=handler_map or None,
         )
+        sfig.legends.append(legend)
 
-        if base_legend:
-            # Matplotlib has no public API for this, so it is a bit of a hack.
-            # Ideally we'd define our own legend class with more flexibility,
-            # but that is a lot of work!
-            base_legend_box = base_legend.get_children()[0]
-            this_legend_box = legend.get_children()[0]
-            base_legend_box.get_children().extend(this_legend_box.get_children())
-        else:
-            base_legend = legend
-            sfig.legends.append(legend)
+
+def _bound_entries(handles, labels, max_entries, overflow):
+    """
+    Return at most `max_entries` legend entries, where the levels left out
+    are shown as a strip of their colors.
+    """
+    if overflow == "other":
+        keep = max_entries - 1
+        text = f"{len(labels) - keep} others"
+    elif overflow == "summary":
+        keep = 0
+        text = f"{labels[0]} – {labels[-1]} ({len(labels)})"
+    else:
+        raise ValueError(f"`overflow` must be 'other' or 'summary', not {overflow!r}.")
+
+    strip = tuple(
+        mpl.patches.Rectangle((0, 0), 1, 1, color=_artist_color(artists[0]), lw=0)
+        for artists in handles[keep:]
+    )
+    handler_map = {strip: mpl.legend_handler.HandlerTuple(ndivide=None, pad=0)}
+    return [*handles[:keep], strip], [*labels[:keep], text], handler_map
+
+
+def _artist_color(artist):
+    """Return the first visible color of a legend artist."""
+    for getter in ["get_markerfacecolor", "get_facecolor", "get_color", "get_edgecolor"]:
+        if hasattr(artist, getter):
+            colors = mpl.colors.to_rgba_array(getattr(artist, getter)())
+            if len(colors) and colors[0, 3] > 0:
+                return colors[0]
+    return "none"
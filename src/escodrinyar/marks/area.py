@@ -1,5 +1,8 @@
 from __future__ import annotations
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+import os
 from seaborn._marks.area import AreaBase
 from seaborn._marks.base import (
     Mark,
@@ -8,8 +11,15 @@ from seaborn._marks.base import (
     MappableFloat,
     MappableColor,
     document_properties,
+    resolve_properties,
+    resolve_color,
 )
-import scipy
+import matplotlib as mpl
+import numpy as np
+from matplotlib.patheffects import AbstractPathEffect
+
+from .. import cache
+from .view import clip_polygon, viewport
 
 
 @document_properties
@@ -17,6 +27,10 @@ import scipy
 class Polygon(AreaBase, Mark):
     """
     A fill mark representing a polygon.
+
+    When `simplify` is set, the outline is simplified at draw time with the
+    Douglas-Peucker algorithm, so that it deviates at most `simplify` pixels
+    of the output from the original one.
     """
 
     color: MappableColor = Mappable(
@@ -41,6 +55,44 @@ class Polygon(AreaBase, Mark):
         "-",
     )
 
+    simplify: float | None = None
+
+    def _plot(self, split_gen, scales, orient):
+        patches = defaultdict(list)
+
+        for keys, data, ax in split_gen():
+            kws = {}
+            data = self._standardize_coordinate_parameters(data, orient)
+            resolved = resolve_properties(self, keys, scales)
+            verts = self._get_verts(data, orient)
+            ax.update_datalim(verts)
+
+            # Only the part inside of fixed axis limits is drawn
+            view = viewport(ax)
+            if view is not None:
+                verts = clip_polygon(verts, ax, view)
+                if not len(verts):
+                    continue
+
+            # TODO should really move this logic into resolve_color
+            fc = resolve_color(self, keys, "", scales)
+            if not resolved["fill"]:
+                fc = mpl.colors.to_rgba(fc, 0)
+
+            kws["facecolor"] = fc
+            kws["edgecolor"] = resolve_color(self, keys, "edge", scales)
+            kws["linewidth"] = resolved["edgewidth"]
+            kws["linestyle"] = resolved["edgestyle"]
+
+            patches[ax].append(mpl.patches.Polygon(verts, **kws))
+
+        for ax, ax_patches in patches.items():
+            for patch in ax_patches:
+                self._postprocess_artist(patch, ax, orient)
+                # Limits were already updated from the vertices; add_patch
+                # would update them again walking the path in Python
+                ax.add_artist(patch)
+
     def _get_verts(self, data, orient):
         dv = {"x": "y", "y": "x"}[orient]
         verts = data[[orient, dv]].to_numpy()
@@ -48,12 +100,23 @@ class Polygon(AreaBase, Mark):
             verts = verts[:, ::-1]
         return verts
 
+    def _postprocess_artist(self, artist, ax, orient):
+        if self.simplify is not None:
+            artist.set_path_effects([_Simplify(self.simplify)])
+
 
 @document_properties
 @dataclass
 class ConvexHull(Polygon, Mark):
     """
     A fill mark representing a convex hull around points.
+
+    Points that are strictly inside the octagon spanned by the extreme points
+    of each group are discarded before computing the hull, which does not
+    change the hull polygon; with duplicate or collinear points, its outline
+    may start at another vertex than the hull of all the points. With
+    `n_jobs` different from 1, the hulls of all groups are computed in a pool
+    of worker processes (-1 uses all CPUs).
     """
 
     color: MappableColor = Mappable(
@@ -78,6 +141,454 @@ class ConvexHull(Polygon, Mark):
         "-",
     )
 
-    def _standardize_coordinate_parameters(self, data, orient):
-        hull = scipy.spatial.ConvexHull(data[["x", "y"]].to_numpy())
-        return data.iloc[hull.vertices]
+    n_jobs: int | None = None
+
+    def __post_init__(self):
+        if self.n_jobs is not None and not (self.n_jobs == -1 or self.n_jobs >= 1):
+            raise ValueError(
+                f"`n_jobs` must be -1 or a positive integer, not {self.n_jobs!r}."
+            )
+
+    def _plot(self, split_gen, scales, orient):
+        if self.n_jobs in (None, 1):
+            hulls = (
+                (keys, data.iloc[self._hull(data)], ax)
+                for keys, data, ax in split_gen()
+            )
+            return super()._plot(lambda: hulls, scales, orient)
+
+        groups = list(split_gen())
+        points = [data[["x", "y"]].to_numpy() for _, data, _ in groups]
+        hull_keys = [_hull_key(p) for p in points]
+        vertices = [cache.lookup(key) for key in hull_keys]
+
+        missing = [i for i, idx in enumerate(vertices) if idx is None]
+        if missing:
+            max_workers = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+            chunksize = max(len(missing) // (4 * max_workers), 1)
+            with ProcessPoolExecutor(max_workers) as pool:
+                computed = pool.map(
+                    _hull_vertices, [points[i] for i in missing], chunksize=chunksize
+                )
+                for i, idx in zip(missing, computed):
+                    cache.store(hull_keys[i], idx)
+                    vertices[i] = idx
+
+        # Hull vertices are emitted in the order of Qhull, as in the workers
+        hulls = [
+            (keys, data.iloc[idx], ax)
+            for (keys, data, ax), idx in zip(groups, vertices)
+        ]
+        return super()._plot(lambda: iter(hulls), scales, orient)
+
+    def _hull(self, data):
+        points = data[["x", "y"]].to_numpy()
+        return cache.memoize(_hull_key(points), lambda: _hull_vertices(points))
+
+
+@document_properties
+@dataclass
+class Contour(Polygon, Mark):
+    """
+    A fill mark representing the contours of a density on a regular grid.
+
+    It draws the `density` column computed by :class:`KDE2d`. Levels are
+    iso-proportions of the density: a fraction `p` of the mass lies below the
+    contour drawn at level `p`. Filled bands become more opaque towards the
+    mode. Set `fill` to False and `edgewidth` to a positive value to draw
+    contour lines only.
+    """
+
+    color: MappableColor = Mappable(
+        "C0",
+    )
+    alpha: MappableFloat = Mappable(
+        1,
+    )
+    fill: MappableBool = Mappable(
+        True,
+    )
+    edgecolor: MappableColor = Mappable(
+        depend="color",
+    )
+    edgealpha: MappableFloat = Mappable(
+        1,
+    )
+    edgewidth: MappableFloat = Mappable(
+        0,
+    )
+    edgestyle: MappableFloat = Mappable(
+        "-",
+    )
+
+    levels: int | list[float] = 10
+    thresh: float = 0.05
+
+    def _plot(self, split_gen, scales, orient):
+        patches = defaultdict(list)
+
+        # Imported here, as only contours need it
+        import contourpy
+
+        for keys, data, ax in split_gen():
+            xs, ys, z = self._get_grid(data)
+            levels = self._get_levels(z)
+            if len(levels) < 2:
+                continue
+
+            resolved = resolve_properties(self, keys, scales)
+            fc = resolve_color(self, keys, "", scales)
+            generator = contourpy.contour_generator(
+                xs, ys, z, line_type="SeparateCode", fill_type="OuterCode"
+            )
+
+            outer = _contour_path(*generator.lines(levels[0]))
+            if outer is not None:
+                ax.update_datalim(outer.vertices)
+
+            if resolved["fill"]:
+                nbands = len(levels) - 1
+                for i, (lower, upper) in enumerate(zip(levels[:-1], levels[1:])):
+                    path = _contour_path(*generator.filled(lower, upper))
+                    if path is None:
+                        continue
+                    patches[ax].append(
+                        mpl.patches.PathPatch(
+                            path,
+                            facecolor=(*fc[:3], fc[3] * (i + 1) / nbands),
+                            edgecolor="none",
+                            linewidth=0,
+                        )
+                    )
+
+            if resolved["edgewidth"] > 0:
+                for level in levels[:-1]:
+                    path = _contour_path(*generator.lines(level))
+                    if path is None:
+                        continue
+                    patches[ax].append(
+                        mpl.patches.PathPatch(
+                            path,
+                            fill=False,
+                            edgecolor=resolve_color(self, keys, "edge", scales),
+                            linewidth=resolved["edgewidth"],
+                            linestyle=resolved["edgestyle"],
+                        )
+                    )
+
+        for ax, ax_patches in patches.items():
+            for patch in ax_patches:
+                self._postprocess_artist(patch, ax, orient)
+                ax.add_artist(patch)
+
+    def _get_grid(self, data):
+        xs, xi = np.unique(data["x"].to_numpy(), return_inverse=True)
+        ys, yi = np.unique(data["y"].to_numpy(), return_inverse=True)
+        z = np.zeros((len(ys), len(xs)))
+        z[yi, xi] = data["density"].to_numpy()
+        return xs, ys, z
+
+    def _get_levels(self, z):
+        if np.ndim(self.levels) == 0:
+            isoprop = np.linspace(self.thresh, 1, self.levels)
+        else:
+            isoprop = np.asarray(self.levels)
+
+        # Same convention as seaborn.kdeplot
+        values = np.sort(z.ravel())[::-1]
+        if not values.sum() > 0:
+            return np.array([])
+        mass = np.cumsum(values) / values.sum()
+        idx = np.searchsorted(mass, 1 - isoprop)
+        return np.unique(np.take(values, idx, mode="clip"))
+
+
+def _contour_path(points, codes):
+    if not len(points):
+        return None
+    return mpl.path.Path(np.concatenate(points), np.concatenate(codes))
+
+
+def _hull_key(points):
+    return cache.hash_key("ConvexHull", points) if cache.is_enabled() else None
+
+
+def _hull_vertices(points):
+    """
+    Compute the vertices of the convex hull of a set of points.
+
+    Parameters
+    ----------
+    points : array
+        Array of shape (n, 2) with the point coordinates.
+
+    Returns
+    -------
+    array
+        Indices of the hull vertices, in the order given by Qhull on the
+        candidate points.
+    """
+    # Imported here, as it takes longer to import than to compute most hulls
+    import scipy.spatial
+
+    candidates = _extreme_point_candidates(points)
+    hull = scipy.spatial.ConvexHull(points[candidates])
+    return candidates[hull.vertices]
+
+
+def _extreme_point_candidates(points, min_size=64, rtol=1e-9):
+    """
+    Discard points that cannot be vertices of the convex hull.
+
+    This is the Akl-Toussaint heuristic: the points that are extreme along x,
+    y, x + y and x - y span an octagon contained in the hull, and points
+    strictly inside it are not hull vertices. The remaining points keep their
+    original order.
+
+    Parameters
+    ----------
+    points : array
+        Array of shape (n, 2) with the point coordinates.
+    min_size : int
+        Groups with fewer points are not filtered.
+    rtol : float
+        Tolerance, relative to the extent of the points, used to keep points
+        that are numerically on the boundary of the octagon.
+
+    Returns
+    -------
+    array
+        Indices of the candidate points.
+    """
+    n = len(points)
+    if n < min_size:
+        return np.arange(n)
+
+    x = points[:, 0]
+    y = points[:, 1]
+    s = x + y
+    d = x - y
+    # Counterclockwise, starting from the leftmost point
+    extremes = [
+        np.argmin(x),
+        np.argmin(s),
+        np.argmin(y),
+        np.argmax(d),
+        np.argmax(x),
+        np.argmax(s),
+        np.argmax(y),
+        np.argmin(d),
+    ]
+    octagon = points[extremes]
+    keep = np.any(octagon != np.roll(octagon, -1, axis=0), axis=1)
+    octagon = octagon[keep]
+    if len(octagon) < 3:
+        return np.arange(n)
+
+    scale = max(np.ptp(x), np.ptp(y))
+    inside = np.ones(n, dtype=bool)
+    for start, stop in zip(octagon, np.roll(octagon, -1, axis=0)):
+        edge = stop - start
+        cross = edge[0] * (y - start[1]) - edge[1] * (x - start[0])
+        inside &= cross > rtol * scale * np.hypot(*edge)
+
+    return np.flatnonzero(~inside)
+
+
+class _Simplify(AbstractPathEffect):
+    """Draw closed paths simplified up to a tolerance in display units."""
+
+    def __init__(self, tolerance):
+        super().__init__()
+        self.tolerance = tolerance
+        # Vertices and transform of the last path simplified, and the vertices
+        # kept, as figures are drawn more than once (e.g., by the layout engine)
+        self._cached = None
+
+    def draw_path(self, renderer, gc, tpath, affine, rgbFace=None):
+        codes = tpath.codes
+        simple = (
+            codes is not None
+            and len(codes) > 4
+            and codes[0] == mpl.path.Path.MOVETO
+            and codes[-1] == mpl.path.Path.CLOSEPOLY
+            and np.all(codes[1:-1] == mpl.path.Path.LINETO)
+        )
+        if simple:
+            verts = tpath.vertices[:-1]
+            keep = self._simplify(verts, affine)
+            tpath = mpl.path.Path(
+                np.concatenate([verts[keep], verts[:1]]), closed=True
+            )
+        renderer.draw_path(gc, tpath, affine, rgbFace)
+
+    def _simplify(self, verts, affine):
+        # Paths are transformed anew for each draw, so they are compared by value
+        matrix = affine.get_matrix()
+        if self._cached is not None:
+            cached_verts, cached_matrix, keep = self._cached
+            if np.array_equal(cached_matrix, matrix) and np.array_equal(
+                cached_verts, verts
+            ):
+                return keep
+
+        # The tolerance is in pixels, so simplify in display coordinates
+        keep = _simplify_ring(affine.transform(verts), self.tolerance)
+        self._cached = verts.copy(), matrix.copy(), keep
+        return keep
+
+
+def _simplify_ring(points, tolerance):
+    """
+    Simplify a closed polygon outline with the Douglas-Peucker algorithm.
+
+    Parameters
+    ----------
+    points : array
+        Array of shape (n, 2) with the polygon vertices, without repeating the
+        first one at the end.
+    tolerance : float
+        Maximum distance between the original and the simplified outlines.
+
+    Returns
+    -------
+    array
+        Sorted indices of the vertices to keep; at least three are kept.
+    """
+    n = len(points)
+    if n <= 3 or tolerance <= 0 or not np.all(np.isfinite(points)):
+        return np.arange(n)
+
+    # Collapse thin runs of vertices first, in one pass over the outline, as
+    # Douglas-Peucker goes over all the vertices left at each recursion level
+    # and is much slower on dense or noisy outlines. Each step may move the
+    # outline by half of the tolerance.
+    candidates = _collapse_runs(points, tolerance / 4)
+    if len(candidates) < 3:
+        return np.arange(n)
+
+    # Close the ring so that the first vertex is also the last anchor
+    ring = points[np.concatenate([candidates, [0]])]
+    keep = _douglas_peucker(ring, tolerance / 2)[:-1]
+    if keep.sum() < 3:
+        return np.arange(n)
+    return candidates[keep]
+
+
+def _collapse_runs(points, width, max_size=4096):
+    """
+    Replace runs of consecutive vertices that lie along a thin band.
+
+    Runs are aligned blocks of a power-of-four size, from `max_size` down to
+    4, whose vertices are within `width` of the line through their extreme
+    vertices along the longest side of their bounding box. This includes
+    repeated vertices, straight runs and vertices going back and forth along
+    the band, as in noisy outlines. Each run is represented by its first and
+    last vertices, and by its extreme vertices along the band, which are
+    within twice `width` of the rest.
+
+    Returns
+    -------
+    array
+        Sorted indices of the vertices to keep.
+    """
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    covered = np.zeros(n, dtype=bool)
+
+    size = max_size
+    while size > n:
+        size //= 4
+    starts = np.arange(n // size) * size if size >= 4 else np.array([], dtype=int)
+    while len(starts):
+        # Only blocks within larger blocks that were not collapsed are tested
+        index = starts[:, None] + np.arange(size)
+        bx, by = points[index, 0], points[index, 1]
+        blocks = np.arange(len(starts))
+
+        # The band goes through the extreme vertices along the longest side
+        xlo, xhi = bx.argmin(axis=1), bx.argmax(axis=1)
+        ylo, yhi = by.argmin(axis=1), by.argmax(axis=1)
+        wide = bx[blocks, xhi] - bx[blocks, xlo] >= by[blocks, yhi] - by[blocks, ylo]
+        lo = np.where(wide, xlo, ylo)
+        hi = np.where(wide, xhi, yhi)
+        dx = bx - bx[blocks, lo][:, None]
+        dy = by - by[blocks, lo][:, None]
+        ux = bx[blocks, hi] - bx[blocks, lo]
+        uy = by[blocks, hi] - by[blocks, lo]
+
+        offset = np.abs(dx * uy[:, None] - dy * ux[:, None]).max(axis=1)
+        thin = offset <= width * np.hypot(ux, uy)
+        along = dx * ux[:, None] + dy * uy[:, None]
+        for first in [0, size - 1, along.argmin(axis=1), along.argmax(axis=1)]:
+            keep[(starts + first)[thin]] = True
+        covered[index[thin]] = True
+
+        size //= 4
+        if size < 4:
+            break
+        starts = (starts[~thin, None] + np.arange(0, 4 * size, size)).ravel()
+        # Vertices after the last block of a size are tested in smaller ones
+        tail = np.arange(n // (4 * size) * 4 * size, n - size + 1, size)
+        starts = np.concatenate([starts, tail[~covered[tail]]])
+
+    return np.flatnonzero(keep | ~covered)
+
+
+def _douglas_peucker(points, tolerance):
+    """
+    Douglas-Peucker simplification of a polyline.
+
+    All the segments of each recursion level are processed at once, so that
+    the work is vectorized over the vertex array.
+
+    Returns
+    -------
+    array
+        Boolean mask of the vertices to keep.
+    """
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, n - 1]] = True
+
+    starts = np.array([0])
+    stops = np.array([n - 1])
+    while len(starts):
+        lengths = stops - starts - 1
+        nonempty = lengths > 0
+        starts, stops, lengths = starts[nonempty], stops[nonempty], lengths[nonempty]
+        if not len(starts):
+            break
+
+        # Interior vertices of all segments, concatenated
+        offsets = np.cumsum(lengths) - lengths
+        segment = np.repeat(np.arange(len(starts)), lengths)
+        idx = np.arange(lengths.sum()) - offsets[segment] + starts[segment] + 1
+
+        a = points[starts][segment]
+        b = points[stops][segment]
+        dist = _segment_distance(points[idx], a, b)
+
+        dmax = np.maximum.reduceat(dist, offsets)
+        is_max = np.flatnonzero(dist == dmax[segment])
+        _, first = np.unique(segment[is_max], return_index=True)
+        split = idx[is_max[first]]
+
+        far = dmax > tolerance
+        keep[split[far]] = True
+        starts, stops = (
+            np.concatenate([starts[far], split[far]]),
+            np.concatenate([split[far], stops[far]]),
+        )
+
+    return keep
+
+
+def _segment_distance(p, a, b):
+    ab = b - a
+    ap = p - a
+    length2 = np.einsum("ij,ij->i", ab, ab)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.einsum("ij,ij->i", ap, ab) / length2
+    t = np.clip(np.nan_to_num(t), 0, 1)
+    return np.hypot(*(ap - t[:, None] * ab).T)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from seaborn._marks.base import Mark, document_properties
+import numpy as np
+
+
+@document_properties
+@dataclass
+class Limits(Mark):
+    """
+    A mark that draws nothing, but extends the axis limits to its data.
+
+    It keeps the limits of a plot whose other layers only show a summary of
+    the data, e.g. centroids, without drawing the data invisibly: only the
+    extent of the coordinates of each axes is computed, and no artist or
+    legend entry is created.
+    """
+
+    def _plot(self, split_gen, scales, orient):
+        for _, data, ax in split_gen():
+            lower, upper = [], []
+            for axis in "xy":
+                columns = [c for c in data if c in [axis, f"{axis}min", f"{axis}max"]]
+                values = data[columns].to_numpy(dtype=float)
+                values = values[np.isfinite(values)]
+                if values.size:
+                    lower.append(values.min())
+                    upper.append(values.max())
+                else:
+                    lower.append(np.nan)
+                    upper.append(np.nan)
+
+            update = ~np.isnan(lower)
+            if update.any():
+                ax.update_datalim(
+                    [lower, upper], updatex=update[0], updatey=update[1]
+                )
+
+    def _legend_artist(self, variables, value, scales):
+        return None
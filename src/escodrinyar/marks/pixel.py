@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from seaborn._marks.base import (
+    Mark,
+    Mappable,
+    MappableColor,
+    MappableFloat,
+    document_properties,
+    resolve_color,
+    resolve_properties,
+)
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+
+# Alpha of the pixels with the fewest points, so that they remain visible
+_MIN_ALPHA = 40 / 255
+
+
+@document_properties
+@dataclass
+class Pixels(Mark):
+    """
+    A mark that aggregates points into the pixels of the axes.
+
+    Points are binned into a grid with the size of the axes in the output,
+    which is computed at draw time from the axes extent and the figure dpi,
+    and drawn as a single image, so the cost of drawing does not depend on
+    the number of points.
+
+    The pixels are colored by the `reduce` function: "count" shades the
+    color of the mark by the number of points; "mean" maps the mean of a
+    numeric `color` variable with its scale; and "mix" blends the colors of
+    the levels of a categorical `color` variable, weighted by their number
+    of points, and shades them by the total number of points. By default,
+    it is "mix" when `color` is mapped to categories, "mean" when it is
+    mapped to numbers, and "count" otherwise.
+
+    Counts are normalized with `norm`: "linear", "log" or "eq_hist"
+    (histogram equalization, which spreads the levels of shading evenly
+    across the pixels). With `cmap`, counts are mapped with a colormap
+    instead of shading the color of the mark.
+    """
+
+    color: MappableColor = Mappable(
+        "C0",
+        grouping=False,
+    )
+    alpha: MappableFloat = Mappable(
+        1,
+        grouping=False,
+    )
+
+    reduce: str | None = None
+    norm: str = "eq_hist"
+    cmap: str | mpl.colors.Colormap | None = None
+
+    def _plot(self, split_gen, scales, orient):
+        for _, data, ax in split_gen():
+            if data.empty:
+                continue
+            xy = data[["x", "y"]].to_numpy(dtype=float)
+            ax.update_datalim([xy.min(axis=0), xy.max(axis=0)])
+
+            reduce = self.reduce
+            if reduce is None:
+                if "color" not in data:
+                    reduce = "count"
+                elif pd.api.types.is_numeric_dtype(data["color"]) and not isinstance(
+                    data["color"].dtype, pd.CategoricalDtype
+                ):
+                    reduce = "mean"
+                else:
+                    reduce = "mix"
+
+            resolved = resolve_properties(self, {}, scales)
+            if reduce == "count":
+                color = resolve_color(self, {}, "", scales)
+                artist = _PixelImage(xy, self._shade(color, resolved["alpha"]))
+            elif reduce == "mean":
+                values = data["color"].to_numpy(dtype=float)
+                artist = _PixelImage(
+                    xy, self._average(scales, resolved["alpha"]), values
+                )
+            elif reduce == "mix":
+                codes, levels = pd.factorize(data["color"], sort=False)
+                colors = resolve_color(self, {"color": pd.Series(levels)}, "", scales)
+                artist = _PixelImage(
+                    xy, self._mix(np.asarray(colors), resolved["alpha"]), codes
+                )
+            else:
+                raise ValueError(
+                    f"`reduce` must be 'count', 'mean' or 'mix', not {reduce!r}."
+                )
+
+            artist.update(self.artist_kws)
+            ax.add_artist(artist)
+
+    def _intensity(self, counts):
+        """Normalize the positive `counts` to (0, 1]."""
+        if self.norm == "linear":
+            return counts / counts.max()
+        if self.norm == "log":
+            return np.log1p(counts) / np.log1p(counts.max())
+        if self.norm == "eq_hist":
+            _, inverse, frequency = np.unique(
+                counts, return_inverse=True, return_counts=True
+            )
+            return (np.cumsum(frequency) / len(counts))[inverse]
+        raise ValueError(
+            f"`norm` must be 'linear', 'log' or 'eq_hist', not {self.norm!r}."
+        )
+
+    def _shade(self, color, alpha):
+        def colorize(flat, n, values):
+            counts = np.bincount(flat, minlength=n)
+            drawn = counts > 0
+            t = self._intensity(counts[drawn])
+            rgba = np.zeros((n, 4))
+            if self.cmap is None:
+                rgba[drawn] = mpl.colors.to_rgba(color)
+                rgba[drawn, 3] *= _MIN_ALPHA + (1 - _MIN_ALPHA) * t
+            else:
+                rgba[drawn] = mpl.colormaps.get_cmap(self.cmap)(t)
+                rgba[drawn, 3] *= alpha
+            return rgba
+
+        return colorize
+
+    def _average(self, scales, alpha):
+        def colorize(flat, n, values):
+            counts = np.bincount(flat, minlength=n)
+            drawn = counts > 0
+            means = np.bincount(flat, values, minlength=n)[drawn] / counts[drawn]
+            rgba = np.zeros((n, 4))
+            rgba[drawn] = resolve_color(self, {"color": pd.Series(means)}, "", scales)
+            rgba[drawn, 3] = alpha
+            return rgba
+
+        return colorize
+
+    def _mix(self, colors, alpha):
+        def colorize(flat, n, codes):
+            k = len(colors)
+            counts = np.bincount(flat * k + codes, minlength=n * k).reshape(n, k)
+            total = counts.sum(axis=1)
+            drawn = total > 0
+            rgba = np.zeros((n, 4))
+            rgba[drawn, :3] = counts[drawn] @ colors[:, :3] / total[drawn, None]
+            t = self._intensity(total[drawn])
+            rgba[drawn, 3] = alpha * (_MIN_ALPHA + (1 - _MIN_ALPHA) * t)
+            return rgba
+
+        return colorize
+
+    def _legend_artist(self, variables, value, scales):
+        keys = {v: value for v in variables}
+        return mpl.patches.Patch(
+            facecolor=resolve_color(self, keys, "", scales),
+            edgecolor="none",
+            **self.artist_kws,
+        )
+
+
+class _PixelImage(mpl.artist.Artist):
+    """
+    An image of points binned into the pixels of the axes when drawn.
+
+    `colorize` receives the flat pixel index of each point in the axes, the
+    number of pixels and the values of the points, and returns the RGBA
+    color of each pixel.
+    """
+
+    def __init__(self, xy, colorize, values=None):
+        super().__init__()
+        self.set_zorder(mpl.patches.Patch.zorder)
+        self._xy = xy
+        self._colorize = colorize
+        self._values = values
+
+    @mpl.artist.allow_rasterization
+    def draw(self, renderer):
+        if not self.get_visible() or not len(self._xy):
+            return
+
+        # Vector backends place images in points, but sample them in pixels
+        magnification = renderer.get_image_magnification()
+        bbox = self.axes.bbox
+        width = max(int(np.ceil(bbox.width * magnification)), 1)
+        height = max(int(np.ceil(bbox.height * magnification)), 1)
+
+        points = self.axes.transData.transform(self._xy)
+        i = np.floor((points[:, 0] - bbox.x0) * magnification)
+        j = np.floor((points[:, 1] - bbox.y0) * magnification)
+        inside = (i >= 0) & (i < width) & (j >= 0) & (j < height)
+        flat = (j[inside] * width + i[inside]).astype(np.intp)
+        values = None if self._values is None else self._values[inside]
+
+        rgba = self._colorize(flat, width * height, values)
+        # Renderers take images with the first row at the bottom
+        image = rgba.reshape(height, width, 4)
+        image = (np.clip(image, 0, 1) * 255).round().astype(np.uint8)
+
+        renderer.open_group("pixels", gid=self.get_gid())
+        gc = renderer.new_gc()
+        self._set_gc_clip(gc)
+        gc.set_alpha(self.get_alpha() if self.get_alpha() is not None else 1)
+        renderer.draw_image(gc, bbox.x0, bbox.y0, image)
+        gc.restore()
+        renderer.close_group("pixels")
+        self.stale = False
@@ -12,16 +12,27 @@ from seaborn._marks.base import (
     resolve_properties,
     resolve_color,
 )
+from seaborn._core.rules import categorical_order
+import numpy as np
+import pandas as pd
 import matplotlib as mpl
 
+from .view import viewport, visible_rects
+
 
 class RectBase:
     def _plot(self, split_gen, scales, orient):
-        patches = defaultdict(list)
+        artists = defaultdict(list)
+
+        for _, data, ax in split_gen():
+            view = viewport(ax)
+            if view is not None:
+                data = self._cull(data, scales, orient, ax, view)
+                if data.empty:
+                    continue
 
-        for keys, data, ax in split_gen():
-            kws = {}
-            resolved = resolve_properties(self, keys, scales)
+            data = self._sort_levels(data, scales)
+            resolved = self._resolve_properties(data, scales)
             data = self._standardize_coordinate_parameters(data, resolved, orient)
             verts = self._get_verts(data, orient)
 
@@ -32,29 +43,61 @@ class RectBase:
 
             ax.update_datalim([[xmin, ymin], [xmax, ymax]])
 
-            # TODO should really move this logic into resolve_color
-            fc = resolve_color(self, keys, "", scales)
-            if not resolved["fill"]:
-                fc = mpl.colors.to_rgba(fc, 0)
-
-            kws["facecolor"] = fc
-            kws["edgecolor"] = resolve_color(self, keys, "edge", scales)
-            kws["linewidth"] = resolved["edgewidth"]
-            kws["linestyle"] = resolved["edgestyle"]
-
-            for xmin, xmax, ymin, ymax in verts:
-                verts_i = [
-                    [xmin, ymin],
-                    [xmin, ymax],
-                    [xmax, ymax],
-                    [xmax, ymin],
-                ]
-                patches[ax].append(mpl.patches.Polygon(verts_i, **kws))
-
-        for ax, ax_patches in patches.items():
-            for patch in ax_patches:
-                self._postprocess_artist(patch, ax, orient)
-                ax.add_patch(patch)
+            artists[ax].append(self._make_artist(verts, resolved, ax))
+
+        for ax, ax_artists in artists.items():
+            for artist in ax_artists:
+                self._postprocess_artist(artist, ax, orient)
+                if isinstance(artist, mpl.image.AxesImage):
+                    artist.set_clip_path(ax.patch)
+                    ax.add_image(artist)
+                else:
+                    ax.add_collection(artist, autolim=False)
+
+    def _cull(self, data, scales, orient, ax, view):
+        """
+        Drop the rectangles that lie outside of `view`, before resolving their
+        colors, after extending the data limits to all of them.
+        """
+        resolved = resolve_properties(self, data, scales)
+        verts = self._get_verts(
+            self._standardize_coordinate_parameters(data, resolved, orient), orient
+        )
+        ax.update_datalim(
+            [
+                [verts[:, 0].min(), verts[:, 2].min()],
+                [verts[:, 1].max(), verts[:, 3].max()],
+            ]
+        )
+        return data[visible_rects(verts, ax, view)]
+
+    def _sort_levels(self, data, scales):
+        """
+        Sort the rows stably by the levels of the mapped properties, so that
+        rectangles drawn in a single artist stack as if each level were drawn
+        as its own artist, in the order of the levels.
+        """
+        keys = []
+        for var in self._mappable_props:
+            if var not in data:
+                continue
+            values = data[var]
+            order = getattr(scales.get(var), "order", None)
+            if order is None and pd.api.types.is_numeric_dtype(values):
+                # Numeric levels are in ascending order
+                keys.append(values.to_numpy())
+                continue
+            if order is None:
+                order = categorical_order(values)
+            keys.append(pd.Categorical(values, categories=order).codes)
+
+        if not keys:
+            return data
+        # The first property varies slowest, as in seaborn's groups
+        index = np.lexsort(keys[::-1])
+        if np.all(index[1:] > index[:-1]):
+            return data
+        return data.iloc[index]
 
     def _standardize_coordinate_parameters(self, data, resolved, orient):
         return data
@@ -71,17 +114,50 @@ class RectBase:
 
         return verts
 
+    def _get_polys(self, verts):
+        # (n, 4) array of extents -> (n, 4, 2) array of corners
+        xmin, xmax, ymin, ymax = verts.T
+        return np.stack(
+            [
+                np.column_stack([xmin, ymin]),
+                np.column_stack([xmin, ymax]),
+                np.column_stack([xmax, ymax]),
+                np.column_stack([xmax, ymin]),
+            ],
+            axis=1,
+        )
+
+    def _make_artist(self, verts, resolved, ax):
+        return mpl.collections.PolyCollection(
+            self._get_polys(verts),
+            facecolors=resolved["facecolor"],
+            edgecolors=resolved["edgecolor"],
+            linewidths=resolved["edgewidth"],
+            linestyles=resolved["edgestyle"],
+        )
+
+    def _resolve_properties(self, data, scales):
+        resolved = resolve_properties(self, data, scales)
+
+        # TODO should really move this logic into resolve_color
+        fc = resolve_color(self, data, "", scales)
+        if isinstance(fc, tuple):
+            fc = fc[0], fc[1], fc[2], fc[3] * resolved["fill"]
+        else:
+            fc[:, 3] = fc[:, 3] * resolved["fill"]
+
+        resolved["facecolor"] = fc
+        resolved["edgecolor"] = resolve_color(self, data, "edge", scales)
+
+        return resolved
+
     def _legend_artist(self, variables, value, scales):
         keys = {v: value for v in variables}
-        resolved = resolve_properties(self, keys, scales)
-
-        fc = resolve_color(self, keys, "", scales)
-        if not resolved["fill"]:
-            fc = mpl.colors.to_rgba(fc, 0)
+        resolved = self._resolve_properties(keys, scales)
 
         return mpl.patches.Patch(
-            facecolor=fc,
-            edgecolor=resolve_color(self, keys, "edge", scales),
+            facecolor=resolved["facecolor"],
+            edgecolor=resolved["edgecolor"],
             linewidth=resolved["edgewidth"],
             linestyle=resolved["edgestyle"],
             **self.artist_kws,
@@ -97,24 +173,31 @@ class Rect(RectBase, Mark):
 
     color: MappableColor = Mappable(
         "C0",
+        grouping=False,
     )
     alpha: MappableFloat = Mappable(
         0.2,
+        grouping=False,
     )
     fill: MappableBool = Mappable(
         True,
+        grouping=False,
     )
     edgecolor: MappableColor = Mappable(
         depend="color",
+        grouping=False,
     )
     edgealpha: MappableFloat = Mappable(
         1,
+        grouping=False,
     )
     edgewidth: MappableFloat = Mappable(
         0,
+        grouping=False,
     )
     edgestyle: MappableFloat = Mappable(
         "-",
+        grouping=False,
     )
 
 
@@ -123,35 +206,51 @@ class Rect(RectBase, Mark):
 class Tile(RectBase, Mark):
     """
     A fill mark representing a tile.
+
+    When `raster` is True and the tiles of a group lie on a regular grid
+    with constant size, they are drawn as a single image instead of one
+    vector shape per tile. Groups that are not on a regular grid, that have
+    visible edges or that are drawn on non-linear scales fall back to the
+    vector representation.
     """
 
     color: MappableColor = Mappable(
         "C0",
+        grouping=False,
     )
     alpha: MappableFloat = Mappable(
         1,
+        grouping=False,
     )
     fill: MappableBool = Mappable(
         True,
+        grouping=False,
     )
     edgecolor: MappableColor = Mappable(
         depend="color",
+        grouping=False,
     )
     edgealpha: MappableFloat = Mappable(
         1,
+        grouping=False,
     )
     edgewidth: MappableFloat = Mappable(
         0,
+        grouping=False,
     )
     edgestyle: MappableFloat = Mappable(
         "-",
+        grouping=False,
     )
     tilewidth: MappableFloat = Mappable(
         1,
+        grouping=False,
     )  # width noun is already taken
     tileheight: MappableFloat = Mappable(
         1,
+        grouping=False,
     )
+    raster: bool = False
 
     def _standardize_coordinate_parameters(self, data, resolved, orient):
         # create xmin, xmax, ymin, ymax columns
@@ -164,18 +263,168 @@ class Tile(RectBase, Mark):
 
         return data
 
-    def _legend_artist(self, variables, value, scales):
-        keys = {v: value for v in variables}
-        resolved = resolve_properties(self, keys, scales)
+    def _make_artist(self, verts, resolved, ax):
+        if self.raster:
+            image = self._make_image(verts, resolved, ax)
+            if image is not None:
+                return image
+        return super()._make_artist(verts, resolved, ax)
 
-        fc = resolve_color(self, keys, "", scales)
-        if not resolved["fill"]:
-            fc = mpl.colors.to_rgba(fc, 0)
+    def _make_image(self, verts, resolved, ax):
+        if np.any(np.asarray(resolved["edgewidth"]) > 0):
+            return None
 
-        return mpl.patches.Patch(
-            facecolor=fc,
-            edgecolor=resolve_color(self, keys, "edge", scales),
-            linewidth=resolved["edgewidth"],
-            linestyle=resolved["edgestyle"],
-            **self.artist_kws,
+        grid = _regular_grid(verts)
+        if grid is None:
+            return None
+        i, j, nx, ny = grid
+
+        fc = np.nan_to_num(mpl.colors.to_rgba_array(resolved["facecolor"]))
+        image = np.zeros((ny, nx, 4))
+        image[j, i] = fc
+
+        x0 = verts[:, 0].min()
+        y0 = verts[:, 2].min()
+        width = verts[0, 1] - verts[0, 0]
+        height = verts[0, 3] - verts[0, 2]
+
+        # An image can only be stretched linearly between its extent
+        xedges = x0 + width * np.arange(nx + 1)
+        yedges = y0 + height * np.arange(ny + 1)
+        if not (_is_linear(ax.xaxis, xedges) and _is_linear(ax.yaxis, yedges)):
+            return None
+
+        artist = mpl.image.AxesImage(
+            None,
+            origin="lower",
+            extent=(x0, x0 + nx * width, y0, y0 + ny * height),
+            interpolation="nearest",
+            zorder=mpl.patches.Patch.zorder,
         )
+        artist.set_data(image)
+        return artist
+
+
+@document_properties
+@dataclass
+class HexTile(RectBase, Mark):
+    """
+    A fill mark representing a pointy-top hexagonal tile.
+
+    The hexagon is inscribed in the same box as a :class:`Tile` with the
+    same position and size.
+    """
+
+    color: MappableColor = Mappable(
+        "C0",
+        grouping=False,
+    )
+    alpha: MappableFloat = Mappable(
+        1,
+        grouping=False,
+    )
+    fill: MappableBool = Mappable(
+        True,
+        grouping=False,
+    )
+    edgecolor: MappableColor = Mappable(
+        depend="color",
+        grouping=False,
+    )
+    edgealpha: MappableFloat = Mappable(
+        1,
+        grouping=False,
+    )
+    edgewidth: MappableFloat = Mappable(
+        0,
+        grouping=False,
+    )
+    edgestyle: MappableFloat = Mappable(
+        "-",
+        grouping=False,
+    )
+    tilewidth: MappableFloat = Mappable(
+        1,
+        grouping=False,
+    )
+    tileheight: MappableFloat = Mappable(
+        1,
+        grouping=False,
+    )
+
+    def _standardize_coordinate_parameters(self, data, resolved, orient):
+        return Tile._standardize_coordinate_parameters(self, data, resolved, orient)
+
+    def _get_polys(self, verts):
+        # (n, 4) array of extents -> (n, 6, 2) array of hexagon corners
+        xmin, xmax, ymin, ymax = verts.T
+        xmid = (xmin + xmax) / 2
+        ymid = (ymin + ymax) / 2
+        side = (ymax - ymin) / 4
+        return np.stack(
+            [
+                np.column_stack([xmid, ymax]),
+                np.column_stack([xmax, ymid + side]),
+                np.column_stack([xmax, ymid - side]),
+                np.column_stack([xmid, ymin]),
+                np.column_stack([xmin, ymid - side]),
+                np.column_stack([xmin, ymid + side]),
+            ],
+            axis=1,
+        )
+
+
+def _is_linear(axis, edges):
+    steps = np.diff(axis.get_transform().transform(edges))
+    return np.all(np.isfinite(steps)) and np.allclose(steps, steps[0])
+
+
+def _regular_grid(verts, rtol=1e-6):
+    """
+    Locate rectangles on a regular grid of non-overlapping cells.
+
+    Parameters
+    ----------
+    verts : array
+        Array of shape (n, 4) with the xmin, xmax, ymin and ymax of each cell.
+    rtol : float
+        Relative tolerance, in units of cell size.
+
+    Returns
+    -------
+    tuple or None
+        Column and row index of each cell and the number of columns and rows
+        of the grid, or None if the cells are not on a regular grid.
+    """
+    width = verts[:, 1] - verts[:, 0]
+    height = verts[:, 3] - verts[:, 2]
+    if width[0] <= 0 or height[0] <= 0:
+        return None
+    if not (
+        np.allclose(width, width[0], rtol=rtol, atol=0)
+        and np.allclose(height, height[0], rtol=rtol, atol=0)
+    ):
+        return None
+
+    i = (verts[:, 0] - verts[:, 0].min()) / width[0]
+    j = (verts[:, 2] - verts[:, 2].min()) / height[0]
+    i_int = np.rint(i)
+    j_int = np.rint(j)
+    if not (
+        np.allclose(i, i_int, rtol=0, atol=rtol * max(i_int.max(), 1))
+        and np.allclose(j, j_int, rtol=0, atol=rtol * max(j_int.max(), 1))
+    ):
+        return None
+
+    i = i_int.astype(np.intp)
+    j = j_int.astype(np.intp)
+    nx = i.max() + 1
+    ny = j.max() + 1
+
+    # Very sparse grids would turn into mostly transparent, oversized images
+    if nx * ny > 4 * len(verts) + 1024:
+        return None
+    if len(np.unique(j * nx + i)) != len(verts):
+        return None
+
+    return i, j, nx, ny
@@ -0,0 +1,112 @@
+"""
+Culling of shapes against the fixed limits of the axes, so that marks only
+build artists for what is visible.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# Fraction of the view added on each side, so that edges of shapes clipped
+# or culled outside of the view are not drawn inside of it
+MARGIN = 0.1
+
+
+def viewport(ax, margin=MARGIN):
+    """
+    Return the fixed limits of `ax` in the coordinates of its scales.
+
+    Returns
+    -------
+    list or None
+        The (low, high) limits of the x and y axes, widened by `margin` of
+        their span, or None for axes that are autoscaled; None if both are.
+    """
+    bounds = []
+    for axis, autoscale in [
+        (ax.xaxis, ax.get_autoscalex_on()), (ax.yaxis, ax.get_autoscaley_on())
+    ]:
+        if autoscale:
+            bounds.append(None)
+            continue
+        lo, hi = np.sort(axis.get_transform().transform(axis.get_view_interval()))
+        pad = margin * (hi - lo)
+        bounds.append((lo - pad, hi + pad))
+    return None if bounds == [None, None] else bounds
+
+
+def visible_rects(verts, ax, view):
+    """
+    Return whether each rectangle intersects `view`.
+
+    Parameters
+    ----------
+    verts : array
+        Array of shape (n, 4) with the xmin, xmax, ymin and ymax of each
+        rectangle, in data coordinates.
+    ax : Axes
+        The axes whose scales transform the coordinates.
+    view : list
+        The limits returned by :func:`viewport`.
+    """
+    visible = np.ones(len(verts), dtype=bool)
+    for k, (axis, bounds) in enumerate(zip([ax.xaxis, ax.yaxis], view)):
+        if bounds is None:
+            continue
+        transform = axis.get_transform()
+        a = transform.transform(verts[:, 2 * k])
+        b = transform.transform(verts[:, 2 * k + 1])
+        # Comparisons with NaN (e.g., negative values on a log scale) are
+        # False, so that those rectangles are kept
+        lo, hi = bounds
+        visible &= ~((np.maximum(a, b) < lo) | (np.minimum(a, b) > hi))
+    return visible
+
+
+def clip_polygon(verts, ax, view):
+    """
+    Clip the polygon with vertices `verts` (in data coordinates) to `view`.
+
+    The polygon is clipped in the coordinates of the scales, where its
+    edges are drawn as straight lines, with the Sutherland-Hodgman
+    algorithm. An empty array is returned if it lies outside of the view.
+    """
+    axes = [ax.xaxis, ax.yaxis]
+    points = np.column_stack([
+        axis.get_transform().transform(verts[:, k]) for k, axis in enumerate(axes)
+    ])
+    if not np.isfinite(points).all():
+        return verts
+
+    clipped = False
+    for k, bounds in enumerate(view):
+        if bounds is None:
+            continue
+        for bound, sign in zip(bounds, [1, -1]):
+            inside = sign * (points[:, k] - bound) >= 0
+            if inside.all():
+                continue
+            clipped = True
+            if not inside.any():
+                return verts[:0]
+            points = _clip_edges(points, inside, k, bound)
+
+    if not clipped:
+        return verts
+    return np.column_stack([
+        axis.get_transform().inverted().transform(points[:, k])
+        for k, axis in enumerate(axes)
+    ])
+
+
+def _clip_edges(points, inside, k, bound):
+    # Each vertex is kept if it is inside, followed by the intersection of
+    # its edge to the next vertex with the boundary, if the edge crosses it
+    after = np.roll(points, -1, axis=0)
+    crossing = inside != np.roll(inside, -1)
+    # Only edges that cross the boundary have finite intersections
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (bound - points[:, k]) / (after[:, k] - points[:, k])
+        intersections = points + t[:, None] * (after - points)
+    intersections[:, k] = bound
+    keep = np.column_stack([inside, crossing])
+    return np.stack([points, intersections], axis=1)[keep]
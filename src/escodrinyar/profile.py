@@ -0,0 +1,173 @@
+"""
+Opt-in timing of the stages of rendering layouts, by cell and layer.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any
+
+import pandas as pd
+
+
+class Report:
+    """
+    Timings of the stages of rendering, recorded by :func:`record`.
+
+    Each event has the `name` and `category` of a stage, its `start` and
+    `duration` in seconds, and the `cell` and `layer` it belongs to, if any.
+    Stat and mark stages also name the class in `target`. When memory is
+    traced, events also hold the bytes `allocated` (net) and the `peak` of
+    the memory allocated during the stage.
+
+    Nested stages, such as the stats of a cell, are included in the duration
+    of the enclosing ones.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.events: list[dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._stack: list[dict] = []
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the events as a DataFrame, one row per event."""
+        return pd.DataFrame(self.events)
+
+    def to_json(self, path: str | os.PathLike | None = None) -> str:
+        """Return the events as JSON, also written to `path` if given."""
+        text = json.dumps({"events": self.events}, indent=1, default=str)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def to_chrome_trace(self, path: str | os.PathLike | None = None) -> dict:
+        """
+        Return the events in the Trace Event Format, which Chrome's tracing
+        tool and Perfetto display, also written to `path` if given.
+        """
+        pid = os.getpid()
+        trace = {
+            "traceEvents": [
+                {
+                    "name": event["name"] if event["target"] is None
+                    else f"{event['name']} {event['target']}",
+                    "cat": event["category"],
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["duration"] * 1e6,
+                    "pid": pid,
+                    "tid": 0,
+                    "args": {
+                        k: v for k, v in event.items()
+                        if k not in ["name", "category", "start", "duration"]
+                        and v is not None
+                    },
+                }
+                for event in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(trace, f, default=str)
+        return trace
+
+    @contextmanager
+    def _span(self, name, category, args):
+        parent = self._stack[-1]["event"] if self._stack else {}
+        event = {
+            "name": name,
+            "category": category,
+            "cell": parent.get("cell"),
+            "layer": parent.get("layer"),
+            "target": None,
+            **args,
+        }
+        frame = {"event": event, "peak": 0}
+        if self.memory:
+            # The peak is reset for each stage, so the enclosing stage keeps
+            # the highest one seen so far
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            tracemalloc.reset_peak()
+            frame["current"] = current
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield event
+        finally:
+            end = time.perf_counter()
+            self._stack.pop()
+            event["start"] = start - self._origin
+            event["duration"] = end - start
+            if self.memory:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, frame["peak"])
+                event["allocated"] = current - frame["current"]
+                event["peak"] = peak - frame["current"]
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            self.events.append(event)
+
+
+_report: Report | None = None
+
+
+@contextmanager
+def record(memory: bool = False):
+    """
+    Record the stages of the layouts plotted, saved or displayed in the
+    context.
+
+    Parameters
+    ----------
+    memory : bool
+        Whether to also trace the memory allocated by each stage, with
+        :mod:`tracemalloc`, which slows rendering down.
+
+    Yields
+    ------
+    Report
+        The report that the stages are added to.
+
+    Notes
+    -----
+    Cells rendered by worker processes (see :meth:`Layout.opts`) are timed
+    as a whole, as their stages run in other processes.
+
+    """
+    global _report
+    report = Report(memory)
+    previous, _report = _report, report
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield report
+    finally:
+        _report = previous
+        if started:
+            tracemalloc.stop()
+
+
+def is_recording() -> bool:
+    """Return whether stages are being recorded."""
+    return _report is not None
+
+
+def span(name: str, category: str, **args):
+    """
+    Return a context that records a stage in the active report, if any.
+
+    The event of the stage is yielded, so that arguments known at the end
+    can be added to it.
+    """
+    if _report is None:
+        return nullcontext({})
+    return _report._span(name, category, args)
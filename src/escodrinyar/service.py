@@ -0,0 +1,276 @@
+"""
+Rendering of layouts to image bytes for concurrent callers, such as the
+request handlers of web services.
+"""
+from __future__ import annotations
+
+import asyncio
+import copy
+import io
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import matplotlib as mpl
+import numpy as np
+from seaborn.objects import Plot as SeabornPlot
+
+from .layout import Layout, Plot, _savefig
+
+# Matplotlib settings are global to a process, so renders in threads of the
+# same process run one at a time
+_render_lock = threading.Lock()
+
+
+class RenderService:
+    """
+    A pool of workers that render layouts to image bytes.
+
+    Renders never use pyplot, so no figure is kept after a render, and each
+    one runs with the matplotlib settings and options of :class:`Layout` of
+    the service creation: changes made by a render or by the caller
+    afterwards do not affect other renders.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of worker processes (-1 uses all CPUs). Default is None (one
+        per CPU).
+    max_pending : int
+        Maximum number of renders submitted and not finished; further ones
+        raise :class:`queue.Full`, e.g. to answer that a service is busy.
+        Default is None (unbounded).
+    processes : bool
+        Whether workers are processes, which render in parallel. Otherwise,
+        a thread renders one layout at a time from a copy of it and of its
+        data, which avoids sending them to other processes. Default is True.
+    format : str
+        Default format of the images, e.g. "png" or "svg".
+    history : int
+        Number of recent renders whose timings are summarized by
+        :meth:`metrics`.
+
+    Examples
+    --------
+    >>> with RenderService(max_workers=4, max_pending=64) as service:
+    ...     png = service.render(plot)
+    ...     svg = await service.render_async(layout, format="svg")
+
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        processes: bool = True,
+        format: str = "png",
+        history: int = 1000,
+    ):
+        if max_workers is None or max_workers == -1:
+            max_workers = os.cpu_count() or 1
+        self.format = format
+        self.max_pending = max_pending
+        self._state = (
+            dict(mpl.rcParams), dict(SeabornPlot.config.theme), dict(Layout.legend)
+        )
+        if processes:
+            self.max_workers = max_workers
+            self._pool = ProcessPoolExecutor(max_workers)
+        else:
+            self.max_workers = 1
+            self._pool = ThreadPoolExecutor(1)
+        self._processes = processes
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._timings: deque = deque(maxlen=history)
+
+    def submit(self, layout: Layout | Plot, format: str | None = None, **kwargs) -> Future:
+        """
+        Start rendering `layout`, and return a future of its image bytes.
+
+        Parameters
+        ----------
+        layout : Layout or Plot
+            What is rendered. Later changes to it do not affect the render.
+        format : str
+            Format of the image. Default is the format of the service.
+        kwargs
+            Passed to :meth:`matplotlib.figure.Figure.savefig`, e.g. `dpi`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future of the image bytes.
+
+        """
+        if isinstance(layout, Plot):
+            layout = Layout([[layout]])
+        # Cells are rendered sequentially, as requests are rendered in parallel
+        layout = Layout(layout.layout).opts(
+            layout.figsize, layout.width_ratios, layout.height_ratios
+        )
+        if not self._processes:
+            # Isolated from later changes of the caller, as in other processes
+            layout = _copy(layout)
+
+        with self._lock:
+            if self.max_pending is not None and self._pending >= self.max_pending:
+                self._counts["rejected"] += 1
+                raise queue.Full(f"{self._pending} renders are already pending.")
+            self._pending += 1
+            self._counts["submitted"] += 1
+
+        start = time.perf_counter()
+        try:
+            future = self._pool.submit(
+                _render, layout, format or self.format, kwargs, self._state
+            )
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        result = Future()
+
+        def done(future):
+            latency = time.perf_counter() - start
+            error = None if future.cancelled() else future.exception()
+            with self._lock:
+                self._pending -= 1
+                if future.cancelled() or error is not None:
+                    self._counts["failed"] += 1
+                else:
+                    self._counts["completed"] += 1
+                    image, duration = future.result()
+                    self._timings.append((latency - duration, duration, latency))
+            if future.cancelled():
+                result.cancel()
+            elif error is not None:
+                result.set_exception(error)
+            else:
+                result.set_result(image)
+
+        future.add_done_callback(done)
+        return result
+
+    def render(
+        self,
+        layout: Layout | Plot,
+        format: str | None = None,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> bytes:
+        """
+        Render `layout`, and return its image bytes.
+
+        Parameters are those of :meth:`submit`, and a `timeout` in seconds
+        after which :class:`TimeoutError` is raised.
+        """
+        return self.submit(layout, format, **kwargs).result(timeout)
+
+    async def render_async(
+        self, layout: Layout | Plot, format: str | None = None, **kwargs
+    ) -> bytes:
+        """
+        Render `layout` without blocking the event loop, and return its
+        image bytes.
+
+        Parameters are those of :meth:`submit`.
+        """
+        return await asyncio.wrap_future(self.submit(layout, format, **kwargs))
+
+    def metrics(self) -> dict:
+        """
+        Return counts of renders and timings of the recent ones.
+
+        The counts are those of renders `submitted`, `completed`, `failed`
+        and `rejected` for exceeding `max_pending`; `pending` renders are
+        either rendering or `queued` for a worker. The timings, in seconds,
+        are the `mean`, `p50`, `p95` and `max` of the time renders wait for
+        a worker (`queue`), render (`render`) and take in total (`latency`).
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            pending = self._pending
+            timings = np.array(self._timings, dtype=float).reshape(-1, 3)
+
+        metrics = {
+            **counts,
+            "pending": pending,
+            "queued": max(pending - self.max_workers, 0),
+            "workers": self.max_workers,
+        }
+        for name, values in zip(["queue", "render", "latency"], timings.T):
+            if len(values):
+                metrics[name] = {
+                    "mean": float(values.mean()),
+                    "p50": float(np.percentile(values, 50)),
+                    "p95": float(np.percentile(values, 95)),
+                    "max": float(values.max()),
+                }
+            else:
+                metrics[name] = dict.fromkeys(["mean", "p50", "p95", "max"])
+        return metrics
+
+    def close(self, wait: bool = True):
+        """Stop the workers, after the pending renders if `wait`."""
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _render(layout, fmt, kwargs, state):
+    """Render `layout` with the `state` of its service, in any thread."""
+    rc_params, theme, legend = state
+    # The format is given apart from the savefig kwargs
+    kwargs = {key: value for key, value in kwargs.items() if key != "format"}
+    with _render_lock:
+        start = time.perf_counter()
+        old_theme, old_legend = dict(SeabornPlot.config.theme), Layout.legend
+        try:
+            with mpl.rc_context(rc_params):
+                SeabornPlot.config.theme.update(theme)
+                Layout.legend = legend
+                layout._plot_for(None, {**kwargs, "format": fmt})
+                buffer = io.BytesIO()
+                _savefig(layout.fig, buffer, format=fmt, **kwargs)
+        finally:
+            SeabornPlot.config.theme.update(old_theme)
+            Layout.legend = old_legend
+            layout.fig = None
+            layout._rendered = {}
+        return buffer.getvalue(), time.perf_counter() - start
+
+
+def _copy(layout):
+    """
+    Copy the cells of `layout` and their data, which are drawn from their own
+    specs.
+    """
+    # Data shared by several cells or layers is copied once, and stays shared
+    memo = {}
+    rows = [[_copy_plot(plot, memo) for plot in row] for row in layout.layout]
+    return Layout(rows).opts(layout.figsize, layout.width_ratios, layout.height_ratios)
+
+
+def _copy_plot(plot, memo):
+    spec = plot.splot._clone()
+    spec._data = copy.deepcopy(spec._data, memo)
+    spec._layers = [
+        {
+            **layer,
+            "source": copy.deepcopy(layer["source"], memo),
+            "vars": copy.deepcopy(layer["vars"], memo),
+        }
+        for layer in spec._layers
+    ]
+    copied = Plot(spec)
+    copied.rc_params = dict(plot.rc_params)
+    return copied
@@ -0,0 +1,171 @@
+"""
+Declarative specifications of layouts, read from JSON or YAML files.
+
+A spec names its data sources, its plots and how they are composed::
+
+    {
+      "data": {"penguins": "penguins.csv"},
+      "plots": {
+        "points": {
+          "data": "penguins",
+          "x": "bill_length_mm", "y": "bill_depth_mm", "color": "species",
+          "layers": [{"mark": {"type": "Dot", "marker": "."}}]
+        },
+        "centroids": {
+          "data": "penguins",
+          "x": "bill_length_mm", "y": "bill_depth_mm", "color": "species",
+          "layers": [{"mark": "Dot", "transforms": ["Agg2d"]}]
+        }
+      },
+      "layout": [["points", ["points", "centroids"]]],
+      "opts": {"figsize": [7, 4]},
+      "output": ["penguins.png", "penguins.svg"]
+    }
+
+Data sources are CSV or Parquet files, given by path, or by the parameters
+of :class:`Chunks` to be read in chunks. Rows of `layout` hold cells, which
+are the name of a plot, a plot, or a list of them to overlay. Marks, stats,
+moves and scales are given by class name, or as a mapping with the class
+name in `type` and the parameters of the object; they are looked up in
+escodrinyar and then in :mod:`seaborn.objects`. Paths are relative to the
+spec file.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+from typing import Any
+
+import pandas as pd
+
+from .chunks import Chunks
+from .layout import Layout, Plot
+
+_PLOT_KEYS = ["data", "layers", "scale", "limit", "facet", "pair", "label", "theme"]
+
+
+def load(path: str | os.PathLike) -> dict:
+    """Read a spec from a JSON or YAML file."""
+    path = os.fspath(path)
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError as err:
+                raise ImportError("Reading YAML specs requires PyYAML.") from err
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def build(spec: dict, base: str | os.PathLike = ".") -> Layout:
+    """
+    Return the layout described by `spec`, with paths relative to `base`.
+    """
+    sources = {
+        name: _read_source(source, base) for name, source in spec.get("data", {}).items()
+    }
+    plots = spec.get("plots", {})
+
+    def cell(value):
+        if isinstance(value, list):
+            # Plots of a cell are overlaid
+            return functools.reduce(lambda a, b: a * b, map(cell, value))
+        if isinstance(value, str):
+            if value not in plots:
+                raise ValueError(f"Unknown plot {value!r}.")
+            value = plots[value]
+        return _build_plot(value, sources, base)
+
+    rows = spec.get("layout")
+    if rows is None:
+        raise ValueError("A spec needs a `layout`.")
+    layout = Layout([[cell(value) for value in row] for row in rows])
+    return layout.opts(**spec.get("opts", {}))
+
+
+def outputs(spec: dict, base: str | os.PathLike = ".") -> list[str]:
+    """Return the paths of the files that `spec` is written to."""
+    return [os.path.join(base, path) for path in spec.get("output", [])]
+
+
+def _build_plot(spec, sources, base):
+    data = spec.get("data")
+    if isinstance(data, str):
+        data = sources[data] if data in sources else _read_source(data, base)
+    variables = {k: v for k, v in spec.items() if k not in _PLOT_KEYS}
+    plot = Plot(data=data, **variables)
+
+    for layer in spec.get("layers", []):
+        layer = dict(layer)
+        mark = _resolve(layer.pop("mark"))
+        transforms = [_resolve(t) for t in layer.pop("transforms", [])]
+        layer_vars = layer.pop("vars", {})
+        plot = plot.add(mark, *transforms, **layer, **layer_vars)
+
+    if "scale" in spec:
+        plot = plot.scale(**{k: _resolve(v) for k, v in spec["scale"].items()})
+    if "limit" in spec:
+        plot = plot.limit(**{k: tuple(v) for k, v in spec["limit"].items()})
+    if "facet" in spec:
+        plot = plot.facet(**spec["facet"])
+    if "pair" in spec:
+        plot = plot.pair(**spec["pair"])
+    if "label" in spec:
+        plot = plot.label(**spec["label"])
+    if "theme" in spec:
+        plot = plot.theme(spec["theme"])
+    return plot
+
+
+def _read_source(source, base):
+    if isinstance(source, dict):
+        params = dict(source)
+        return Chunks(os.path.join(base, params.pop("source")), **params)
+    path = os.path.join(base, source)
+    stat = os.stat(path)
+    return _read_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_file(path, mtime, size):
+    # Keyed by modification time and size, so that specs rendered by the same
+    # process share the frames of files that did not change
+    if path.endswith((".parquet", ".pq")):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def _classes():
+    import seaborn.objects as so
+
+    import escodrinyar
+
+    classes = {}
+    for module in [so, escodrinyar]:
+        for name in dir(module):
+            value = getattr(module, name)
+            if isinstance(value, type) and issubclass(
+                value, (so.Mark, so.Stat, so.Move, so.Scale, escodrinyar.ApproxQuantile)
+            ):
+                classes[name] = value
+    return classes
+
+
+def _resolve(value: Any) -> Any:
+    """Instantiate the objects named in `value`, recursively."""
+    if isinstance(value, str):
+        cls = _classes_cached().get(value)
+        return value if cls is None else cls()
+    if isinstance(value, dict) and "type" in value:
+        params = {k: _resolve(v) for k, v in value.items() if k != "type"}
+        cls = _classes_cached().get(value["type"])
+        if cls is None:
+            raise ValueError(f"Unknown type {value['type']!r}.")
+        return cls(**params)
+    if isinstance(value, dict):
+        return {k: _resolve(v) for k, v in value.items()}
+    return value
+
+
+_classes_cached = functools.cache(_classes)
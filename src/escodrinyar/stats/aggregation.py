@@ -1,14 +1,21 @@
 from dataclasses import dataclass
 from typing import ClassVar, Callable
 
+import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
+from seaborn._core.properties import PROPERTIES
 from seaborn._core.scales import Scale
 from seaborn._core.groupby import GroupBy
+from seaborn._core.rules import categorical_order
 from seaborn._stats.base import Stat
 
 from seaborn._core.typing import Vector
 
+from ..cache import cached_stat
+from .sketch import ApproxQuantile, QuantileSketch
+
 
 @dataclass
 class Agg2d(Stat):
@@ -17,14 +24,112 @@ class Agg2d(Stat):
 
     Parameters
     ----------
-    func : str or callable
-        Name of a :class:`pandas.Series` method or a vector -> scalar function.
+    func : str, callable or :class:`ApproxQuantile`
+        Name of a :class:`pandas.Series` method, a vector -> scalar function,
+        or an approximate quantile computed with a mergeable sketch.
+    stats : dict
+        Additional statistics, mapping a suffix to a function as in `func`.
+        Statistics that are coordinates of marks add `x<suffix>` and
+        `y<suffix>` columns; for example, ``{"min": "min", "max": "max"}``
+        adds the `xmin`, `xmax`, `ymin` and `ymax` columns used by range
+        marks. Other statistics add `<suffix>_x` and `<suffix>_y` columns,
+        e.g., `sd_x` and `sd_y` for ``{"sd": "std"}``, which are left in the
+        coordinates of the scales (e.g., logarithms), as seaborn would
+        transform them back as positions otherwise.
+
+    Notes
+    -----
+    The `mean`, `median`, `sum`, `min`, `max`, `std` and `count` methods are
+    computed with NumPy in a single pass over the groups, which are factorized
+    once for all the statistics. Other methods go through pandas.
+
+    When the plot data is a :class:`Chunks` source, the data holds partial
+    aggregates that are merged instead, and only the `mean`, `sum`, `min`,
+    `max`, `std` and `count` methods are available, as well as
+    :class:`ApproxQuantile` when the source keeps sketches.
 
     """
 
     func: str | Callable[[Vector], float] = "mean"
+    stats: dict[str, str | Callable[[Vector], float]] | None = None
     group_by_orient: ClassVar[bool] = False
 
+    def _get_funcs(self):
+        funcs = {"": self.func}
+        if self.stats is not None:
+            for suffix in self.stats:
+                # Its columns would be transformed as coordinates by the scales
+                if suffix[:1] in ["x", "y"]:
+                    raise ValueError(
+                        f"Statistic names cannot start with x or y, got {suffix!r}."
+                    )
+            funcs.update(self.stats)
+        return funcs
+
+    def _agg_fast(self, data, groupby, funcs):
+        codes, res, reduced = _factorize(data, groupby)
+        segments = _Segments(codes, len(res), reduced)
+        stats = {
+            var: segments.reduce(data[var].to_numpy(dtype=float), funcs.values())
+            for var in ["x", "y"]
+        }
+        for i, suffix in enumerate(funcs):
+            for var in ["x", "y"]:
+                res[_stat_column(var, suffix)] = stats[var][i]
+        return groupby._reorder_columns(res, data)
+
+    def _agg(self, data, groupby, funcs):
+        funcs = {
+            suffix: _sketch_reducer(func) if isinstance(func, ApproxQuantile) else func
+            for suffix, func in funcs.items()
+        }
+        agg_dict = {
+            _stat_column(var, suffix): (var, func)
+            for suffix, func in funcs.items()
+            for var in ["x", "y"]
+        }
+        grouper, _ = groupby._get_groups(data)
+        if not grouper:
+            res = DataFrame({k: [data[v].agg(f)] for k, (v, f) in agg_dict.items()})
+            return groupby._reorder_columns(res, data)
+        return groupby.agg(data, **agg_dict)
+
+    def _agg_partials(self, data, groupby, funcs, scales):
+        for func in funcs.values():
+            if not _is_mergeable(func):
+                raise ValueError(
+                    f"Cannot compute {func!r} from partial aggregates of chunked data."
+                )
+            if isinstance(func, ApproxQuantile) and sketch_column("x") not in data:
+                raise ValueError(
+                    f"Cannot compute {func!r} from chunked data without sketches; "
+                    "pass `sketch` to Chunks."
+                )
+        for var in ["x", "y"]:
+            if getattr(scales.get(var), "trans", None) is not None:
+                raise ValueError(
+                    "Partial aggregates of chunked data cannot be transformed by "
+                    f"the {var} scale."
+                )
+
+        codes, res, reduced = _factorize(data, groupby)
+        merged = {}
+        for var in ["x", "y"]:
+            partials = {
+                name: data[col].to_numpy(dtype=float)
+                for name, col in partial_columns(var).items()
+            }
+            merged[var] = _merge_partials(codes, len(res), partials, reduced)
+            if sketch_column(var) in data:
+                merged[var]["sketch"] = _merge_sketches(
+                    codes, len(res), data[sketch_column(var)]
+                )
+        for suffix, func in funcs.items():
+            for var in ["x", "y"]:
+                res[_stat_column(var, suffix)] = _from_partials(merged[var], func)
+        return groupby._reorder_columns(res, data)
+
+    @cached_stat
     def __call__(
         self,
         data: DataFrame,
@@ -32,11 +137,359 @@ class Agg2d(Stat):
         orient: str,
         scales: dict[str, Scale],
     ) -> DataFrame:
-        agg_dict = {
-            "x": self.func,
-            "y": self.func,
-        }
-        res = (
-            groupby.agg(data, agg_dict).dropna(subset=["x", "y"]).reset_index(drop=True)
+        funcs = self._get_funcs()
+        if partial_columns("x")["count"] in data:
+            res = self._agg_partials(data, groupby, funcs, scales)
+        elif all(_is_vectorized(f) for f in funcs.values()):
+            res = self._agg_fast(data, groupby, funcs)
+        else:
+            res = self._agg(data, groupby, funcs)
+        return res.dropna(subset=["x", "y"]).reset_index(drop=True)
+
+
+def _factorize(data, groupby):
+    """
+    Return the group code of each row, a frame with the group levels, and
+    which groups :meth:`GroupBy.agg` reduces.
+
+    Groups are the Cartesian product of the levels of the grouping variables,
+    ordered as in :meth:`GroupBy.agg`. Rows whose keys are missing or not
+    among the levels get a negative code. Like pandas, groups without rows
+    are reduced only when a grouping variable is categorical, and then for
+    all its categories.
+    """
+    codes = np.zeros(len(data), dtype=np.intp)
+    levels = {}
+    observed = []
+    categorical = False
+    for var, order in groupby.order.items():
+        if var not in data:
+            continue
+        # Hash each column once, then place its few unique values in the levels
+        var_codes, uniques = pd.factorize(data[var])
+        if order is None:
+            order = categorical_order(pd.Series(uniques))
+        levels[var] = pd.Index(order)
+        positions = np.append(levels[var].get_indexer(uniques), -1)
+        var_codes = positions[var_codes]
+        codes = np.where(
+            (codes < 0) | (var_codes < 0), -1, codes * len(order) + var_codes
         )
+
+        if isinstance(data[var].dtype, pd.CategoricalDtype):
+            categorical = True
+            observed.append(levels[var].isin(data[var].cat.categories))
+        else:
+            observed.append(levels[var].isin(uniques))
+
+    if not levels:
+        return codes, DataFrame(index=[0]), None
+    groups = pd.MultiIndex.from_product(levels.values(), names=list(levels))
+    reduced = None
+    if categorical:
+        reduced = observed[0]
+        for var_observed in observed[1:]:
+            reduced = np.logical_and.outer(reduced, var_observed).ravel()
+    return codes, groups.to_frame(index=False), reduced
+
+
+def _is_vectorized(func):
+    return isinstance(func, ApproxQuantile) or (
+        isinstance(func, str) and func in _Segments.reducers
+    )
+
+
+def _is_mergeable(func):
+    return isinstance(func, ApproxQuantile) or (
+        isinstance(func, str) and func in _Segments.reducers - {"median"}
+    )
+
+
+def _sketch_reducer(func):
+    def reducer(values):
+        return func.sketch(values).quantile(func.q)
+    return reducer
+
+
+class _Segments:
+    """
+    Vectorized reductions over the groups of a factorized array.
+
+    Values are reduced with :func:`numpy.bincount` or over the sorted segments
+    of each group. Like pandas, missing values are skipped. Groups without
+    rows are NaN unless `reduced` says otherwise.
+    """
+
+    reducers = {"mean", "median", "sum", "min", "max", "std", "count"}
+
+    def __init__(self, codes, ngroups, reduced=None):
+        # Rows whose keys are not among the group levels have a negative code
+        self.rows = None if codes.min(initial=0) >= 0 else codes >= 0
+        self.codes = codes if self.rows is None else codes[self.rows]
+        self.ngroups = ngroups
+        if reduced is None:
+            reduced = np.bincount(self.codes, minlength=ngroups) > 0
+        self.empty = ~reduced
+        self._order = None
+
+    @property
+    def order(self):
+        # Shared by the reductions of all the variables
+        if self._order is None:
+            self._order = self._sort_by_code(self.codes)
+        return self._order
+
+    def _sort_by_code(self, codes):
+        # NumPy uses a radix sort for stable sorts of small integer types
+        if self.ngroups <= np.iinfo(np.uint16).max:
+            codes = codes.astype(np.uint16)
+        return np.argsort(codes, kind="stable")
+
+    def reduce(self, values, funcs):
+        """Reduce `values` with each of `funcs`, sharing the intermediate steps."""
+        if self.rows is not None:
+            values = values[self.rows]
+        full, codes = values, self.codes
+        missing = np.isnan(values)
+        if not missing.any():
+            missing = None
+        else:
+            codes = codes[~missing]
+            values = values[~missing]
+
+        count = np.bincount(codes, minlength=self.ngroups).astype(float)
+        start = np.cumsum(count) - count
+        some = count > 0
+        stats = {"count": count}
+
+        def get(func):
+            if func in stats:
+                return stats[func]
+            if func == "sum":
+                res = np.bincount(codes, weights=values, minlength=self.ngroups)
+            elif func == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    res = get("sum") / count
+            elif func == "std":
+                mean = get("mean")
+                sq = np.bincount(
+                    codes, weights=(values - mean[codes]) ** 2, minlength=self.ngroups
+                )
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    res = np.sqrt(sq / (count - 1))
+                res[count < 2] = np.nan
+            elif func == "grouped":
+                # Values sorted by group, keeping the original order within
+                order = self.order
+                if missing is not None:
+                    order = order[~missing[order]]
+                res = full[order]
+            elif func in ["min", "max"]:
+                ufunc = np.minimum if func == "min" else np.maximum
+                res = np.full(self.ngroups, np.nan)
+                res[some] = ufunc.reduceat(get("grouped"), start[some].astype(np.intp))
+            elif isinstance(func, tuple):  # sketches with a given capacity
+                grouped = get("grouped")
+                res = np.full(self.ngroups, None, dtype=object)
+                for i in np.flatnonzero(some):
+                    lo = int(start[i])
+                    res[i] = ApproxQuantile(k=func[1]).sketch(grouped[lo:lo + int(count[i])])
+            elif isinstance(func, ApproxQuantile):
+                # Quantiles with the same capacity share the sketches
+                res = np.array([
+                    np.nan if sketch is None else sketch.quantile(func.q)
+                    for sketch in get(("sketch", func.k))
+                ])
+            elif self.ngroups * 1000 < len(values):  # median of a few large groups
+                # Linear-time selection within each segment
+                grouped = get("grouped")
+                res = np.full(self.ngroups, np.nan)
+                for i in np.flatnonzero(some):
+                    lo = int(start[i])
+                    res[i] = np.median(grouped[lo:lo + int(count[i])])
+            else:  # median
+                # Sort by value, then stably by group
+                by_value = np.argsort(values)
+                res = values[by_value[self._sort_by_code(codes[by_value])]]
+                n = count[some].astype(np.intp)
+                lo = start[some].astype(np.intp)
+                out = np.full(self.ngroups, np.nan)
+                out[some] = (res[lo + (n - 1) // 2] + res[lo + n // 2]) / 2
+                res = out
+            stats[func] = res
+            return res
+
+        res = [get(func) for func in funcs]
+        for r in res:
+            r[self.empty] = np.nan
         return res
+
+
+def _stat_column(var, suffix):
+    """
+    Return the column of the `suffix` statistic of `var`, which seaborn only
+    treats as a coordinate of `var` when it starts with its name.
+    """
+    column = f"{var}{suffix}"
+    return column if column in PROPERTIES else f"{suffix}_{var}"
+
+
+PARTIALS = ["count", "sum", "m2", "min", "max"]
+
+
+def partial_columns(var):
+    """Return the names of the columns with the partial aggregates of `var`."""
+    # Names must not start with x or y, which seaborn takes for coordinates
+    return {name: f"{name}_{var}" for name in PARTIALS}
+
+
+def sketch_column(var):
+    """Return the name of the column with the quantile sketches of `var`."""
+    return f"sketch_{var}"
+
+
+def has_partials(data):
+    """
+    Return whether `data` holds the partial aggregates of chunked data, as
+    marked by :func:`aggregate_chunks`, and not columns with the same names.
+    """
+    return isinstance(data, DataFrame) and data.attrs.get(_PARTIALS_ATTR, False)
+
+
+_PARTIALS_ATTR = "escodrinyar.partials"
+
+
+def _merge_partials(codes, ngroups, partials, reduced=None):
+    """
+    Merge the partial aggregates of the rows sharing each group code.
+
+    Partials are the count of valid values, their sum, the sum of squared
+    deviations from their mean (`m2`, merged as in Chan et al.'s parallel
+    algorithm), and their minimum and maximum. Raw values are partials of
+    a single value.
+    """
+    keep = codes >= 0
+    codes = codes[keep]
+    partials = {name: values[keep] for name, values in partials.items()}
+    count = partials["count"]
+
+    merged = {
+        "count": np.bincount(codes, weights=count, minlength=ngroups),
+        "sum": np.bincount(codes, weights=partials["sum"], minlength=ngroups),
+    }
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = merged["sum"] / merged["count"]
+        deviation = np.where(count > 0, partials["sum"] / count - mean[codes], 0)
+    merged["m2"] = np.bincount(
+        codes, weights=partials["m2"] + count * deviation**2, minlength=ngroups
+    )
+    for name, ufunc in [("min", np.fmin), ("max", np.fmax)]:
+        merged[name] = np.full(ngroups, np.nan)
+        ufunc.at(merged[name], codes, partials[name])
+
+    if reduced is None:
+        reduced = np.bincount(codes, minlength=ngroups) > 0
+    for values in merged.values():
+        values[~reduced] = np.nan
+    return merged
+
+
+def _merge_sketches(codes, ngroups, sketches):
+    merged = np.full(ngroups, None, dtype=object)
+    for code, sketch in zip(codes, sketches):
+        if code < 0 or sketch is None:
+            continue
+        if merged[code] is None:
+            merged[code] = QuantileSketch(sketch.k, seed=0)
+        merged[code].merge(sketch)
+    return merged
+
+
+def _from_partials(merged, func):
+    if isinstance(func, ApproxQuantile):
+        return np.array([
+            np.nan if sketch is None else sketch.quantile(func.q)
+            for sketch in merged["sketch"]
+        ])
+    count = merged["count"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if func == "mean":
+            return merged["sum"] / count
+        if func == "std":
+            return np.where(count > 1, np.sqrt(merged["m2"] / (count - 1)), np.nan)
+    return merged[func]
+
+
+def aggregate_chunks(chunks, x, y, keys, sketch=None):
+    """
+    Reduce an iterable of DataFrames to partial aggregates of `x` and `y`.
+
+    The result has one row for each combination of the `keys` columns, with
+    the mean of `x` and `y` under their own names and their partial
+    aggregates in the :func:`partial_columns`. When `sketch` is given, it is
+    the capacity of the :class:`QuantileSketch` of each row, kept in the
+    :func:`sketch_column`. Only the partials of the current chunk and of the
+    distinct keys seen so far are held in memory. The result is marked as
+    partials for :func:`has_partials`.
+    """
+    result = None
+    for chunk in chunks:
+        frame = DataFrame({key: chunk[key] for key in keys})
+        for var, col in [("x", x), ("y", y)]:
+            values = chunk[col].to_numpy(dtype=float)
+            valid = ~np.isnan(values)
+            names = partial_columns(var)
+            frame[names["count"]] = valid.astype(float)
+            frame[names["sum"]] = np.where(valid, values, 0)
+            frame[names["m2"]] = 0.0
+            frame[names["min"]] = values
+            frame[names["max"]] = values
+        frame = _merge_frame(frame, keys, sketch)
+        if result is not None:
+            frame = pd.concat([result, frame], ignore_index=True)
+            frame = _merge_frame(frame, keys, sketch)
+        result = frame
+
+    if result is None:
+        raise ValueError("Chunked data has no chunks.")
+    result.attrs[_PARTIALS_ATTR] = True
+    for var, col in [("x", x), ("y", y)]:
+        names = partial_columns(var)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[col] = result[names["sum"]] / result[names["count"]]
+    return result
+
+
+def _merge_frame(frame, keys, sketch):
+    if keys:
+        grouped = frame.groupby(keys, sort=False, dropna=False, observed=True)
+        codes = grouped.ngroup().to_numpy()
+        first = np.unique(codes, return_index=True)[1]
+        res = frame[keys].iloc[first].reset_index(drop=True)
+    else:
+        codes = np.zeros(len(frame), dtype=np.intp)
+        res = DataFrame(index=[0])
+    for var in ["x", "y"]:
+        names = partial_columns(var)
+        partials = {
+            name: frame[col].to_numpy(dtype=float) for name, col in names.items()
+        }
+        merged = _merge_partials(codes, len(res), partials)
+        for name, col in names.items():
+            res[col] = merged[name]
+
+        if sketch is None:
+            continue
+        col = sketch_column(var)
+        if col in frame:
+            res[col] = _merge_sketches(codes, len(res), frame[col])
+        else:
+            # Raw values are the minimum of their single-value partials
+            values = partials["min"]
+            order = np.argsort(codes, kind="stable")
+            bounds = np.cumsum(np.bincount(codes, minlength=len(res)))
+            res[col] = [
+                QuantileSketch(sketch, seed=0).update(group)
+                for group in np.split(values[order], bounds[:-1])
+            ]
+    return res
@@ -0,0 +1,226 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+from pandas import DataFrame
+
+from seaborn._core.scales import Scale
+from seaborn._core.groupby import GroupBy
+from seaborn._stats.base import Stat
+
+from ..cache import cached_stat
+
+
+class BinBase:
+    def __post_init__(self):
+        self._check_param_one_of("stat", ["count", "sum", "mean"])
+
+    def _define_range(self, data):
+        if self.binrange is not None:
+            return tuple(tuple(r) for r in self.binrange)
+        x = data["x"].to_numpy(dtype=float)
+        y = data["y"].to_numpy(dtype=float)
+        x = x[np.isfinite(x)]
+        y = y[np.isfinite(y)]
+        return (x.min(), x.max()), (y.min(), y.max())
+
+    def _get_coords(self, data):
+        x = data["x"].to_numpy(dtype=float)
+        y = data["y"].to_numpy(dtype=float)
+        if "weight" in data:
+            weight = data["weight"].to_numpy(dtype=float)
+        else:
+            weight = np.ones(len(data))
+        ok = np.isfinite(x) & np.isfinite(y) & np.isfinite(weight)
+        return x[ok], y[ok], weight[ok]
+
+    def _aggregate(self, idx, weight, size):
+        count = np.bincount(idx, minlength=size)
+        keep = np.flatnonzero(count)
+        if self.stat == "count":
+            return keep, count[keep].astype(float)
+        total = np.bincount(idx, weights=weight, minlength=size)[keep]
+        if self.stat == "mean":
+            total = total / count[keep]
+        return keep, total
+
+    def _make_frame(self, x, y, width, height, value, orient):
+        # Tile reads tilewidth along the orient axis
+        if orient == "x":
+            tilewidth, tileheight = width, height
+        else:
+            tilewidth, tileheight = height, width
+        return DataFrame(
+            {
+                "x": x,
+                "y": y,
+                "tilewidth": tilewidth,
+                "tileheight": tileheight,
+                self.prop: value,
+            }
+        )
+
+    @cached_stat
+    def __call__(
+        self,
+        data: DataFrame,
+        groupby: GroupBy,
+        orient: str,
+        scales: dict[str, Scale],
+    ) -> DataFrame:
+        # Bins are shared by all groups so that their tiles line up
+        grid = self._define_grid(self._define_range(data))
+        return groupby.apply(data, self._eval, orient, grid)
+
+
+@dataclass
+class Bin2d(BinBase, Stat):
+    """
+    Bin observations on a rectangular grid and aggregate them in each bin.
+
+    The output has `x`, `y`, `tilewidth` and `tileheight` columns that can be
+    drawn with :class:`Tile`, and the binned statistic in the `prop` column.
+
+    Parameters
+    ----------
+    stat : str
+        Statistic computed in each bin: `count`, or the `sum` or `mean` of the
+        `weight` variable.
+    bins : int or (int, int)
+        Number of bins along x and y.
+    binwidth : float or (float, float)
+        Width of each bin along x and y; overrides `bins`. The grid extends
+        past the upper end of `binrange` to hold a whole number of bins.
+    binrange : ((xmin, xmax), (ymin, ymax))
+        Extent of the grid. Defaults to the data extremes.
+    prop : str
+        Name of the mark property that receives the statistic.
+
+    """
+
+    stat: str = "count"
+    bins: int | tuple[int, int] = 30
+    binwidth: float | tuple[float, float] | None = None
+    binrange: tuple[tuple[float, float], tuple[float, float]] | None = None
+    prop: str = "color"
+    group_by_orient: ClassVar[bool] = False
+
+    def _define_grid(self, binrange):
+        bins = np.broadcast_to(self.bins, 2)
+        binwidth = None if self.binwidth is None else np.broadcast_to(self.binwidth, 2)
+
+        grid = []
+        for i, (start, stop) in enumerate(binrange):
+            if binwidth is not None:
+                # The grid extends past the range, as in seaborn's Hist, so
+                # that bins have the given width
+                n = max(int(np.ceil((stop - start) / binwidth[i])), 1)
+                stop = start + n * binwidth[i]
+            else:
+                n = int(bins[i])
+                if stop <= start:
+                    start, stop = start - 0.5, stop + 0.5
+            grid.append((start, stop, n))
+        return grid
+
+    def _eval(self, data, orient, grid):
+        x, y, weight = self._get_coords(data)
+        (x0, x1, nx), (y0, y1, ny) = grid
+        wx = (x1 - x0) / nx
+        wy = (y1 - y0) / ny
+
+        ix = np.floor((x - x0) / wx).astype(np.intp)
+        iy = np.floor((y - y0) / wy).astype(np.intp)
+        # The last bin is closed on the right
+        ix[x == x1] = nx - 1
+        iy[y == y1] = ny - 1
+
+        inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        idx = ix[inside] * ny + iy[inside]
+        keep, value = self._aggregate(idx, weight[inside], nx * ny)
+        ix, iy = np.divmod(keep, ny)
+
+        return self._make_frame(
+            x0 + (ix + 0.5) * wx, y0 + (iy + 0.5) * wy, wx, wy, value, orient
+        )
+
+
+@dataclass
+class Hex2d(BinBase, Stat):
+    """
+    Bin observations on a hexagonal grid and aggregate them in each bin.
+
+    The output has `x`, `y`, `tilewidth` and `tileheight` columns that can be
+    drawn with :class:`HexTile`, and the binned statistic in the `prop` column.
+
+    Parameters
+    ----------
+    stat : str
+        Statistic computed in each bin: `count`, or the `sum` or `mean` of the
+        `weight` variable.
+    gridsize : int or (int, int)
+        Number of hexagons along x, or along x and y. When only one value is
+        given, the number along y is chosen so that hexagons are approximately
+        regular, as in :meth:`matplotlib.axes.Axes.hexbin`.
+    binrange : ((xmin, xmax), (ymin, ymax))
+        Extent of the grid. Defaults to the data extremes.
+    prop : str
+        Name of the mark property that receives the statistic.
+
+    """
+
+    stat: str = "count"
+    gridsize: int | tuple[int, int] = 30
+    binrange: tuple[tuple[float, float], tuple[float, float]] | None = None
+    prop: str = "color"
+    group_by_orient: ClassVar[bool] = False
+
+    def _define_grid(self, binrange):
+        if np.ndim(self.gridsize) == 0:
+            nx = int(self.gridsize)
+            ny = max(int(nx / np.sqrt(3)), 1)
+        else:
+            nx, ny = (int(n) for n in self.gridsize)
+
+        (xmin, xmax), (ymin, ymax) = binrange
+        # Pad the extent so that points on its upper edge stay in the grid
+        xpad = 1e-9 * (xmax - xmin) if xmax > xmin else 0.5
+        ypad = 1e-9 * (ymax - ymin) if ymax > ymin else 0.5
+        xmin, xmax = xmin - xpad, xmax + xpad
+        ymin, ymax = ymin - ypad, ymax + ypad
+
+        return (xmin, (xmax - xmin) / nx, nx), (ymin, (ymax - ymin) / ny, ny)
+
+    def _eval(self, data, orient, grid):
+        x, y, weight = self._get_coords(data)
+        (x0, sx, nx), (y0, sy, ny) = grid
+
+        # Two interleaved rectangular lattices; each point goes to the nearest
+        # centre among the two candidates (see matplotlib's hexbin)
+        ix = (x - x0) / sx
+        iy = (y - y0) / sy
+        ix1 = np.round(ix).astype(np.intp)
+        iy1 = np.round(iy).astype(np.intp)
+        ix2 = np.floor(ix).astype(np.intp)
+        iy2 = np.floor(iy).astype(np.intp)
+        d1 = (ix - ix1) ** 2 + 3.0 * (iy - iy1) ** 2
+        d2 = (ix - ix2 - 0.5) ** 2 + 3.0 * (iy - iy2 - 0.5) ** 2
+        first = d1 < d2
+
+        n1 = (nx + 1) * (ny + 1)
+        idx = np.where(
+            first,
+            ix1 * (ny + 1) + iy1,
+            n1 + np.clip(ix2, 0, nx - 1) * ny + np.clip(iy2, 0, ny - 1),
+        )
+        inside = (ix >= 0) & (ix <= nx) & (iy >= 0) & (iy <= ny)
+        keep, value = self._aggregate(idx[inside], weight[inside], n1 + nx * ny)
+
+        in_first = keep < n1
+        i1, j1 = np.divmod(keep[in_first], ny + 1)
+        i2, j2 = np.divmod(keep[~in_first] - n1, ny)
+        cx = np.concatenate([x0 + i1 * sx, x0 + (i2 + 0.5) * sx])
+        cy = np.concatenate([y0 + j1 * sy, y0 + (j2 + 0.5) * sy])
+        value = np.concatenate([value[in_first], value[~in_first]])
+
+        return self._make_frame(cx, cy, sx, 2 * sy / 3, value, orient)
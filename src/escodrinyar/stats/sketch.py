@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    A mergeable summary of a stream of values for approximate quantiles.
+
+    Values are kept in a hierarchy of compactors, as in the KLL sketch: when
+    a level holds more than `k` values, they are sorted and every other one
+    is promoted to the next level with twice the weight.
+
+    Parameters
+    ----------
+    k : int
+        Capacity of each level.
+    seed : int
+        Seed of the random choice of the values kept in each compaction.
+
+    Notes
+    -----
+    Each compaction at level `h` shifts the rank of any value by at most
+    ``2**h``, and a level compacts at most ``n / (k * 2**h)`` times, so the
+    rank of the returned quantile is off by at most ``H * n / k``, where `H`
+    is the number of levels, ``ceil(log2(n / k)) + 1``. With `k` = 2048, that
+    is under 0.7% of the values for 10 million values. As the kept values are
+    chosen at random, typical errors are much smaller. Quantiles are exact
+    while no more than `k` values have been added. The sketch holds at most
+    ``H * k`` values.
+
+    """
+
+    def __init__(self, k: int = 2048, seed: int | None = None):
+        self.k = k
+        self.n = 0
+        self.levels: list[np.ndarray] = []
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values) -> QuantileSketch:
+        """Add the non-missing `values` to the sketch."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        # Bounded batches keep the cost linear in the number of values
+        step = max(self.k, 1 << 16)
+        for start in range(0, len(values), step):
+            self._add(0, values[start:start + step])
+        return self
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Add the values summarized by `other` to the sketch."""
+        for h, level in enumerate(other.levels):
+            self._add(h, level, compact=False)
+        self._compact(0)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Return the approximate `q` quantile, or NaN if the sketch is empty."""
+        if self.n == 0:
+            return np.nan
+        if len(self.levels) == 1:
+            return np.quantile(self.levels[0], q)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 1 << h) for h, level in enumerate(self.levels)]
+        )
+        order = np.argsort(values)
+        cumulative = np.cumsum(weights[order])
+        i = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return values[order][min(i, len(values) - 1)]
+
+    def _add(self, h, values, compact=True):
+        while len(self.levels) <= h:
+            self.levels.append(np.empty(0))
+        self.levels[h] = np.concatenate([self.levels[h], values])
+        self.n += len(values) << h
+        if compact:
+            self._compact(h)
+
+    def _compact(self, h):
+        # Promoted values may overflow the next level, up to a new top one
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) <= self.k:
+                h += 1
+                continue
+            level = np.sort(level)
+            # An odd value out stays at this level
+            keep = len(level) % 2
+            promoted = level[keep + self._rng.integers(2)::2]
+            self.levels[h] = level[:keep]
+            if len(self.levels) == h + 1:
+                self.levels.append(np.empty(0))
+            self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+    def __repr__(self):
+        # Content-addressed, so that cache keys of frames holding sketches
+        # change with what they summarize
+        h = hashlib.blake2b(digest_size=8)
+        for level in self.levels:
+            h.update(level.tobytes())
+            h.update(b"|")
+        return f"QuantileSketch(k={self.k}, n={self.n}, digest={h.hexdigest()})"
+
+
+@dataclass(frozen=True)
+class ApproxQuantile:
+    """
+    Approximate quantile reducer for :class:`Agg2d`.
+
+    Each group is summarized by a :class:`QuantileSketch`, so the cost is
+    linear in the number of values and the memory bounded by group. With
+    :class:`Chunks` data, the sketches built while streaming are merged.
+
+    Parameters
+    ----------
+    q : float
+        Quantile to compute, between 0 and 1.
+    k : int
+        Capacity of each level of the sketch. The rank of the result is off by
+        at most ``(ceil(log2(n / k)) + 1) / k`` of the `n` values of a group.
+
+    """
+
+    q: float = 0.5
+    k: int = 2048
+
+    def sketch(self, values) -> QuantileSketch:
+        """Return a sketch of `values` with the capacity of the reducer."""
+        # A fixed seed makes plots reproducible
+        return QuantileSketch(self.k, seed=0).update(values)
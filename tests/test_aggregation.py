@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+from seaborn._core.groupby import GroupBy
+
+from escodrinyar import Agg2d, ApproxQuantile, QuantileSketch
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 1000
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=n),
+            "y": rng.exponential(size=n),
+            "group": rng.choice(["a", "b", "c"], n),
+        }
+    )
+
+
+@pytest.fixture
+def groupby():
+    return GroupBy(["group"])
+
+
+@pytest.mark.parametrize("func", ["mean", "median", "sum", "min", "max", "std", "count"])
+def test_fast_reducers_match_pandas(df, groupby, func):
+    res = Agg2d(func)(df, groupby, "x", {}).set_index("group")
+    expected = df.groupby("group")[["x", "y"]].agg(func)
+    assert np.allclose(res[["x", "y"]], expected.loc[res.index])
+
+
+def test_other_reducers_go_through_pandas(df, groupby):
+    res = Agg2d(lambda v: v.iloc[0])(df, groupby, "x", {}).set_index("group")
+    expected = df.groupby("group")[["x", "y"]].first()
+    assert np.allclose(res[["x", "y"]], expected.loc[res.index])
+
+
+def test_stats_columns(df, groupby):
+    stats = {"min": "min", "max": "max", "sd": "std"}
+    res = Agg2d(stats=stats)(df, groupby, "x", {}).set_index("group")
+    expected = df.groupby("group")[["x", "y"]]
+    for var in ["x", "y"]:
+        assert np.allclose(res[f"{var}min"], expected.min()[var].loc[res.index])
+        assert np.allclose(res[f"{var}max"], expected.max()[var].loc[res.index])
+        assert np.allclose(res[f"sd_{var}"], expected.std()[var].loc[res.index])
+
+
+def test_stats_cannot_start_with_a_coordinate(df, groupby):
+    with pytest.raises(ValueError, match="cannot start with x or y"):
+        Agg2d(stats={"xerr": "std"})(df, groupby, "x", {})
+
+
+def test_approx_quantile(df, groupby):
+    res = Agg2d(ApproxQuantile(0.9, k=64))(df, groupby, "x", {}).set_index("group")
+    for group, values in df.groupby("group")["y"]:
+        rank = (values < res.loc[group, "y"]).mean()
+        assert abs(rank - 0.9) < 0.05
+
+
+def test_sketch_is_exact_below_capacity():
+    values = np.random.default_rng(0).normal(size=100)
+    sketch = QuantileSketch(k=128).update(values)
+    assert sketch.quantile(0.5) == np.quantile(values, 0.5)
+
+
+def test_sketch_merge():
+    rng = np.random.default_rng(0)
+    a, b = rng.normal(size=50_000), rng.normal(3, size=50_000)
+    merged = QuantileSketch(k=256, seed=0).update(a)
+    merged.merge(QuantileSketch(k=256, seed=1).update(b))
+    assert merged.n == len(a) + len(b)
+    values = np.concatenate([a, b])
+    for q in [0.1, 0.5, 0.9]:
+        rank = (values < merged.quantile(q)).mean()
+        assert abs(rank - q) < 0.02
+    assert sum(map(len, merged.levels)) < len(values) / 50
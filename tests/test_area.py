@@ -0,0 +1,131 @@
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.spatial import ConvexHull as ScipyHull
+
+from escodrinyar import Contour, ConvexHull, KDE2d, Plot, Polygon
+from escodrinyar.marks.area import (
+    _extreme_point_candidates,
+    _hull_vertices,
+    _simplify_ring,
+)
+from escodrinyar.marks.view import clip_polygon, viewport
+
+
+def axes(plot):
+    return plot.plot().fig.subfigs[0].axes[0]
+
+
+def points(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {"x": rng.normal(size=n), "y": rng.normal(size=n), "g": rng.choice(["a", "b"], n)}
+    )
+
+
+def hull_vertices(ax):
+    return sorted(
+        [
+            sorted(map(tuple, np.round(patch.get_xy(), 12)))
+            for patch in ax.patches
+        ]
+    )
+
+
+def test_candidates_keep_the_hull():
+    xy = points()[["x", "y"]].to_numpy()
+    candidates = _extreme_point_candidates(xy)
+    assert len(candidates) < len(xy) / 4
+    hull = ScipyHull(xy).vertices
+    assert set(hull) <= set(candidates)
+
+
+def test_candidates_keep_the_hull_polygon_of_degenerate_points():
+    rng = np.random.default_rng(0)
+    for n in [50, 100, 1000] * 70:
+        xy = rng.integers(0, 20, (n, 2)).astype(float)
+        full = [tuple(p) for p in xy[ScipyHull(xy).vertices]]
+        filtered = [tuple(p) for p in xy[_hull_vertices(xy)]]
+        # The same outline, possibly starting at another vertex
+        start = filtered.index(full[0])
+        assert filtered[start:] + filtered[:start] == full
+
+
+def test_convex_hull_n_jobs():
+    with pytest.raises(ValueError, match="`n_jobs` must be"):
+        ConvexHull(n_jobs=0)
+    ConvexHull(n_jobs=-1)
+
+
+def test_convex_hull_in_workers_matches():
+    df = points()
+    p = Plot(data=df, x="x", y="y", color="g")
+    sequential = hull_vertices(axes(p.add(ConvexHull())))
+    parallel = hull_vertices(axes(p.add(ConvexHull(n_jobs=2))))
+    assert len(sequential) == 2 and sequential == parallel
+
+    # Integer points have duplicates and collinear points on the hull
+    df = points(1000).assign(x=lambda d: d.x.round() * 5, y=lambda d: d.y.round() * 5)
+    p = Plot(data=df, x="x", y="y", color="g")
+    sequential = [patch.get_xy() for patch in axes(p.add(ConvexHull())).patches]
+    parallel = [patch.get_xy() for patch in axes(p.add(ConvexHull(n_jobs=2))).patches]
+    assert len(sequential) == 2
+    assert all(np.array_equal(a, b) for a, b in zip(sequential, parallel))
+
+
+def test_simplify_within_tolerance():
+    t = np.linspace(0, 2 * np.pi, 5000, endpoint=False)
+    rng = np.random.default_rng(0)
+    r = 100 + rng.uniform(-0.1, 0.1, len(t))
+    ring = np.column_stack([r * np.cos(t), r * np.sin(t)])
+    keep = _simplify_ring(ring, 1.0)
+    assert 3 <= len(keep) < len(ring) / 10
+    assert np.all(np.diff(keep) > 0)
+    # The simplified outline stays within the tolerance of every vertex
+    simplified = mpl.path.Path(np.vstack([ring[keep], ring[keep][:1]]))
+    assert simplified.contains_points(ring * 0.98).all()
+    assert not simplified.contains_points(ring * 1.02).any()
+
+
+def test_simplify_keeps_small_rings():
+    ring = np.array([[0, 0], [1, 0], [0, 1]], dtype=float)
+    assert list(_simplify_ring(ring, 10)) == [0, 1, 2]
+
+
+def test_polygon_clipped_to_fixed_limits():
+    square = pd.DataFrame({"x": [0, 10, 10, 0], "y": [0, 0, 10, 10]})
+    ax = axes(Plot(data=square, x="x", y="y").add(Polygon()).limit(x=(0, 2)))
+    (patch,) = ax.patches
+    assert patch.get_xy()[:, 0].max() <= 2 + 0.1 * 2 + 1e-12
+    assert ax.dataLim.x1 == 10
+
+
+def test_clip_polygon_outside_view():
+    fig = mpl.figure.Figure()
+    ax = fig.add_subplot()
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    view = viewport(ax)
+    verts = np.array([[5, 5], [6, 5], [6, 6]], dtype=float)
+    assert not len(clip_polygon(verts, ax, view))
+    inside = np.array([[0.2, 0.2], [0.8, 0.2], [0.5, 0.8]])
+    assert clip_polygon(inside, ax, view) is inside
+
+
+def test_contour_draws_density_bands():
+    df = points()
+    p = Plot(data=df, x="x", y="y").add(Contour(levels=5), KDE2d(gridsize=50))
+    ax = axes(p)
+    assert len(ax.patches) == 4
+    assert all(isinstance(patch, mpl.patches.PathPatch) for patch in ax.patches)
+    alphas = [patch.get_facecolor()[3] for patch in ax.patches]
+    assert alphas == sorted(alphas)
+
+
+def test_contour_lines_only():
+    df = points()
+    mark = Contour(levels=5, fill=False, edgewidth=1)
+    ax = axes(Plot(data=df, x="x", y="y").add(mark, KDE2d(gridsize=50)))
+    assert len(ax.patches) == 4
+    assert not any(patch.get_fill() for patch in ax.patches)
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+from seaborn._core.groupby import GroupBy
+
+from escodrinyar import Bin2d, Hex2d
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {"x": rng.uniform(0, 10, 500), "y": rng.uniform(0, 5, 500), "group": "a"}
+    )
+
+
+@pytest.fixture
+def groupby():
+    return GroupBy(["group"])
+
+
+def test_bin2d_counts_every_point(df, groupby):
+    res = Bin2d(bins=(4, 3))(df, groupby, "x", {})
+    assert res["color"].sum() == len(df)
+    assert len(np.unique(res["x"])) <= 4 and len(np.unique(res["y"])) <= 3
+
+
+def test_bin2d_binwidth(df, groupby):
+    res = Bin2d(binwidth=0.7)(df, groupby, "x", {})
+    assert np.allclose(res["tilewidth"], 0.7)
+    assert np.allclose(res["tileheight"], 0.7)
+    assert res["color"].sum() == len(df)
+    left = res["x"] - res["tilewidth"] / 2
+    assert np.allclose(left - left.min(), np.round((left - left.min()) / 0.7) * 0.7)
+    assert np.isclose(left.min(), df["x"].min())
+
+
+def test_bin2d_mean(df, groupby):
+    df["weight"] = 2.0
+    res = Bin2d(stat="mean", bins=5)(df, groupby, "x", {})
+    assert np.allclose(res["color"], 2)
+
+
+def test_hex2d_counts_every_point(df, groupby):
+    res = Hex2d(gridsize=8)(df, groupby, "x", {})
+    assert res["color"].sum() == len(df)
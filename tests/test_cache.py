@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from seaborn._core.groupby import GroupBy
+
+from escodrinyar import Agg2d, cache
+
+
+@pytest.fixture
+def stat_cache():
+    yield cache.enable()
+    cache.disable()
+
+
+def frame():
+    return pd.DataFrame({"x": np.arange(6.0), "y": np.arange(6.0), "group": "a"})
+
+
+def test_repeated_stats_hit(stat_cache):
+    groupby = GroupBy(["group"])
+    first = Agg2d()(frame(), groupby, "x", {})
+    first["x"] = -1
+    second = Agg2d()(frame(), groupby, "x", {})
+    assert cache.info().hits == 1 and cache.info().misses == 1
+    # Results are copied, as seaborn modifies them in place
+    assert second["x"].iloc[0] == 2.5
+    Agg2d("median")(frame(), groupby, "x", {})
+    assert cache.info().misses == 2
+
+
+def test_disk_cache(tmp_path):
+    groupby = GroupBy(["group"])
+    cache.enable(directory=tmp_path)
+    try:
+        Agg2d()(frame(), groupby, "x", {})
+        cache.enable(directory=tmp_path)
+        Agg2d()(frame(), groupby, "x", {})
+        assert cache.info().hits == 1
+    finally:
+        cache.disable()
+
+
+def test_hash_key():
+    assert cache.hash_key(frame(), "mean") == cache.hash_key(frame(), "mean")
+    assert cache.hash_key(frame(), "mean") != cache.hash_key(frame().iloc[1:], "mean")
+    assert cache.hash_key(frame(), lambda v: v) is None
+    assert cache.hash_key(frame().assign(tags=[[]] * 6)) is None
+
+
+def test_disabled_by_default():
+    assert not cache.is_enabled() and cache.info() is None
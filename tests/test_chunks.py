@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+import seaborn.objects as so
+
+from escodrinyar import Agg2d, ApproxQuantile, Chunks, Plot
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=1000),
+            "y": rng.normal(size=1000),
+            "g": rng.choice(["a", "b", "c"], 1000),
+        }
+    )
+
+
+def points(plot):
+    fig = plot.plot().fig
+    ax = fig.subfigs[0].axes[0]
+    return np.concatenate([c.get_offsets() for c in ax.collections])
+
+
+def chunks(df, size=300):
+    return Chunks(df.iloc[i:i + size] for i in range(0, len(df), size))
+
+
+def test_chunks_are_reduced_to_partials(df):
+    plot = Plot(data=chunks(df), x="x", y="y", color="g")
+    source = plot.splot._data.source_data
+    assert len(source) == 3
+    assert source["count_x"].sum() == len(df)
+
+
+def test_agg2d_merges_partials(df):
+    expected = df.groupby("g")[["x", "y"]].std().sort_values("x").to_numpy()
+    plot = Plot(data=chunks(df), x="x", y="y", color="g").add(so.Dot(), Agg2d("std"))
+    result = points(plot)
+    assert np.allclose(result[np.argsort(result[:, 0])], expected)
+
+
+def test_agg2d_ignores_user_columns_named_as_partials(df):
+    df["count_x"] = 1.0
+    plot = Plot(data=df, x="x", y="y").add(so.Dot(), Agg2d())
+    assert "count_x" not in plot.splot._layers[0]["vars"]
+    assert np.allclose(points(plot), [[df["x"].mean(), df["y"].mean()]])
+
+
+def test_approx_quantile_needs_sketches(df):
+    plot = Plot(data=chunks(df), x="x", y="y").add(so.Dot(), Agg2d(ApproxQuantile(0.5)))
+    with pytest.raises(Exception, match="sketch"):
+        plot.plot()
+    plot = Plot(data=Chunks(chunks(df), sketch=200), x="x", y="y").add(
+        so.Dot(), Agg2d(ApproxQuantile(0.5))
+    )
+    assert np.allclose(points(plot), [df[["x", "y"]].median()], atol=0.1)
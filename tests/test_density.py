@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+from seaborn._core.groupby import GroupBy
+
+from escodrinyar import KDE2d
+
+
+def test_kde2d_integrates_to_one():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {"x": rng.normal(1, 1, 2000), "y": rng.normal(-2, 0.5, 2000), "group": "a"}
+    )
+    res = KDE2d(gridsize=(80, 60))(df, GroupBy(["group"]), "x", {})
+    xs, ys = np.unique(res["x"]), np.unique(res["y"])
+    assert (len(xs), len(ys)) == (80, 60)
+    area = (xs[1] - xs[0]) * (ys[1] - ys[0])
+    assert abs(res["density"].sum() * area - 1) < 0.01
+    # Smoothing does not move the mean
+    for var in ["x", "y"]:
+        mean = np.average(res[var], weights=res["density"])
+        assert abs(mean - df[var].mean()) < 0.01
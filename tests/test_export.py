@@ -0,0 +1,32 @@
+import importlib
+
+import escodrinyar
+import numpy as np
+import pandas as pd
+import seaborn.objects as so
+
+from escodrinyar import Plot
+
+
+def plot():
+    df = pd.DataFrame({"x": np.arange(5.0), "y": np.arange(5.0)})
+    return Plot(data=df, x="x", y="y").add(so.Dot())
+
+
+def test_export_is_not_shadowed_by_its_module():
+    importlib.import_module("escodrinyar._export")
+    assert callable(escodrinyar.export)
+
+
+def test_export_writes_each_target(tmp_path):
+    targets = [tmp_path / "a.png", tmp_path / "a.svg"]
+    written = escodrinyar.export([(plot(), targets)], pdf=tmp_path / "all.pdf")
+    assert written == [str(path) for path in [*targets, tmp_path / "all.pdf"]]
+    assert all(path.stat().st_size > 0 for path in [*targets, tmp_path / "all.pdf"])
+
+
+def test_export_with_a_format(tmp_path):
+    target = tmp_path / "a"
+    escodrinyar.export([(plot(), target)], pdf=tmp_path / "all.pdf", format="png")
+    assert target.read_bytes().startswith(b"\x89PNG")
+    assert (tmp_path / "all.pdf").read_bytes().startswith(b"%PDF")
@@ -0,0 +1,16 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ["seaborn", "matplotlib", "scipy", "pandas"]
+
+
+def test_import_defers_heavy_modules():
+    # A fresh interpreter, as other tests import these modules
+    code = (
+        "import escodrinyar, sys;"
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == []
@@ -0,0 +1,224 @@
+import functools
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+import pytest
+import seaborn.objects as so
+
+import escodrinyar.layout as layout_module
+from escodrinyar import Layout, Plot
+from escodrinyar.layout import _draw_rgba
+
+
+def frame(rows=60, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=rows),
+            "y": rng.normal(size=rows),
+            "g": rng.choice(["a", "b"], rows),
+            "h": rng.choice(["p", "q"], rows),
+        }
+    )
+
+
+def render(layout):
+    return _draw_rgba(layout.plot().fig).copy()
+
+
+def test_mul_keeps_the_data_frame():
+    df = frame()
+    a = Plot(data=df, x="x", y="y", color="g").add(so.Dot())
+    b = Plot(data=df, x="x", y="y", color="g").add(so.Line())
+    plot = a * b
+    assert plot.splot._data.source_data is df
+    assert len(plot.splot._layers) == 2
+
+
+def test_layers_share_factorized_keys():
+    df = frame()
+    df["x"] = df["g"]
+    a = Plot(data=df, x="x", y="y", marker="h").add(so.Dot())
+    _, _, keys = Layout([[a]])._prepare(a, {})
+    assert keys == {}
+    _, _, keys = Layout([[a * a]])._prepare(a * a, {})
+    assert list(keys) == ["marker"]
+    assert list(keys["marker"].cat.categories) == list(df["h"].unique())
+    assert df["h"].dtype == object
+
+
+def test_mul_matches_a_single_plot():
+    df = frame()
+    a = Plot(data=df, x="x", y="y", color="g").add(so.Dot())
+    b = Plot(data=df, x="x", y="y", color="g").add(so.Line())
+    single = Plot(data=df, x="x", y="y", color="g").add(so.Dot()).add(so.Line())
+    assert np.array_equal(render(Layout([[a * b]])), render(Layout([[single]])))
+
+
+def test_mul_with_layer_data():
+    df = frame()
+    other = pd.DataFrame({"x": df["y"], "z": df["x"] * 2})
+    extra = pd.DataFrame({"p": df["x"] + 0.5})
+    a = Plot(data=df, x="x", y="y").add(so.Dot())
+    b = Plot(data=other, x="x", y="z").add(so.Line()).add(so.Dot(), data=extra, x="p")
+    single = (
+        Plot(data=df, x="x", y="y")
+        .add(so.Dot())
+        .add(so.Line(), data=other, x="x", y="z")
+        .add(so.Dot(), data=extra.assign(z=other["z"]), x="p", y="z")
+    )
+    assert np.array_equal(render(Layout([[a * b]])), render(Layout([[single]])))
+
+
+def legend_texts(layout):
+    return [
+        [text.get_text() for text in legend.get_texts()]
+        for sfig in layout.fig.subfigs
+        for legend in sfig.legends
+    ]
+
+
+def test_cells_share_scales_and_facet_levels():
+    df = frame()
+    plot = Plot(data=df, x="x", y="y", color="g").add(so.Dot())
+    layout = plot + plot.facet("h")
+    layout.plot()
+    scales = [v for k, v in layout._prepared.items() if k[1:] == ("g", "color")]
+    assert len(scales) == 1 and scales[0].order == list(df["g"].unique())
+    levels = [v for k, v in layout._prepared.items() if k[1:] == ("h", "col")]
+    assert levels == [list(df["h"].unique())]
+
+
+def test_replot_after_inplace_change():
+    df = frame()
+    plot = Plot(data=df, x="x", y="y", color="g").add(so.Dot())
+    layout = plot + plot.facet("h")
+    layout.plot()
+    df.loc[3, "g"] = "c"
+    df.loc[4, "h"] = "r"
+    image = render(layout)
+    levels = list(df["g"].unique())
+    assert "c" in levels
+    assert legend_texts(layout) == [levels, levels]
+    assert len(layout.fig.subfigs[1].axes) == 3
+    assert np.array_equal(image, render(plot + plot.facet("h")))
+
+
+def test_replot_reuses_unchanged_cells():
+    df = frame()
+    a = Plot(data=df, x="x", y="y").add(so.Dot())
+    b = Plot(data=df, x="x", y="y", color="g").add(so.Dot())
+    layout = a + b
+    layout.plot()
+    first = dict(layout._rendered["subfigures"])
+    layout.layout[0][1] = b.label(title="b")
+    layout.plot()
+    second = layout._rendered["subfigures"]
+    assert second[0, 0][1] is first[0, 0][1]
+    assert second[0, 1][1] is not first[0, 1][1]
+
+
+def test_replot_with_unhashable_column():
+    df = frame().assign(tags=lambda d: [[i] for i in range(len(d))])
+    plot = Plot(data=df, x="x", y="y").add(so.Dot())
+    layout = Layout([[plot]])
+    layout.plot()
+    df.loc[0, "x"] = 100
+    # The cell cannot be fingerprinted, so it is always redrawn
+    assert np.array_equal(render(layout), render(Layout([[plot]])))
+
+
+def test_replot_after_rc_params_change():
+    df = frame()
+    plot = Plot(data=df, x="x", y="y", color="g").add(so.Dot())
+    layout = Layout([[plot]])
+    layout.plot()
+    with mpl.rc_context({"font.size": 20}):
+        image = render(layout)
+        assert np.array_equal(image, render(Layout([[plot]])))
+
+
+def saved(layout):
+    buffer = io.BytesIO()
+    layout.save(buffer, format="png")
+    buffer.seek(0)
+    return mpl.image.imread(buffer)
+
+
+def test_parallel_matches_sequential():
+    df = frame()
+    plot = Plot(data=df, x="x", y="y", color="g").add(so.Dot())
+    sequential = saved((plot + plot.facet("h")).opts(figsize=(8, 4)))
+    layout = (plot + plot.facet("h")).opts(figsize=(8, 4), n_jobs=2)
+    assert np.array_equal(saved(layout), sequential)
+    df.loc[3, "g"] = "c"
+    sequential = saved((plot + plot.facet("h")).opts(figsize=(8, 4)))
+    assert np.array_equal(saved(layout), sequential)
+
+
+def test_parallel_workers_use_the_theme(monkeypatch):
+    # Spawned workers start from the default settings
+    context = multiprocessing.get_context("spawn")
+    monkeypatch.setattr(
+        layout_module,
+        "ProcessPoolExecutor",
+        functools.partial(ProcessPoolExecutor, mp_context=context),
+    )
+    theme = dict(so.Plot.config.theme)
+    so.Plot.config.theme.update({"axes.facecolor": "#ffe0e0", "axes.grid": False})
+    try:
+        plot = Plot(data=frame(), x="x", y="y").add(so.Dot())
+        sequential = saved((plot + plot).opts(figsize=(6, 3)))
+        parallel = saved((plot + plot).opts(figsize=(6, 3), n_jobs=2))
+    finally:
+        so.Plot.config.theme.update(theme)
+    assert np.array_equal(parallel, sequential)
+
+
+def test_display_reuses_images(monkeypatch):
+    df = frame()
+    plot = Plot(data=df, x="x", y="y").add(so.Dot())
+    layout = plot + plot
+    image = layout._repr_png_()
+    assert layout._repr_png_() is image
+    assert layout._repr_svg_() is None
+    layout.layout[0][1] = plot.label(title="b")
+    assert layout._repr_png_() != image
+
+    monkeypatch.setattr(Layout, "display", {**Layout.display, "max_pixels": 10_000})
+    height, width, _ = mpl.image.imread(io.BytesIO(layout._repr_png_())).shape
+    assert width * height <= 10_000
+
+
+def legend_plot(levels=6):
+    df = frame()
+    df["g"] = [chr(ord("a") + i % levels) for i in range(len(df))]
+    return Plot(data=df, x="x", y="y", color="g").add(so.Dot())
+
+
+def test_legend_budget(monkeypatch):
+    layout = Layout([[legend_plot()]])
+    layout.plot()
+    assert legend_texts(layout) == [list("abcdef")]
+
+    monkeypatch.setattr(Layout, "legend", {"max_entries": 3, "overflow": "other"})
+    assert legend_texts(Layout([[legend_plot()]]).plot()) == [["a", "b", "4 others"]]
+    monkeypatch.setattr(Layout, "legend", {"max_entries": 3, "overflow": "summary"})
+    assert legend_texts(Layout([[legend_plot()]]).plot()) == [["a – f (6)"]]
+    monkeypatch.setattr(Layout, "legend", {"max_entries": 0, "overflow": "other"})
+    with pytest.raises(ValueError, match="at least 1"):
+        Layout([[legend_plot()]]).plot()
+
+
+def test_single_legend_for_all_sections():
+    df = frame()
+    plot = Plot(data=df, x="x", y="y", color="g", marker="h").add(so.Dot())
+    layout = Layout([[plot]]).plot()
+    (legend,) = layout.fig.subfigs[0].legends
+    assert legend.get_title().get_text() == "g"
+    texts = [t.get_text() for t in legend.get_texts()]
+    assert texts == [*df["g"].unique(), "h", *df["h"].unique()]
@@ -0,0 +1,16 @@
+import numpy as np
+import pandas as pd
+import seaborn.objects as so
+
+from escodrinyar import Agg2d, Limits, Plot
+
+
+def test_limits_extend_the_axes_without_artists():
+    df = pd.DataFrame({"x": [0.0, 10.0, np.nan], "y": [-5.0, 5.0, 1.0], "g": "a"})
+    plot = Plot(data=df, x="x", y="y").add(Limits()).add(so.Dot(), Agg2d())
+    layout = plot.plot()
+    ax = layout.fig.subfigs[0].axes[0]
+    assert len(ax.collections) == 1 and not ax.lines and not ax.patches
+    assert ax.get_xlim()[0] < 0 and ax.get_xlim()[1] > 10
+    assert ax.get_ylim()[0] < -5 and ax.get_ylim()[1] > 5
+    assert not layout.fig.subfigs[0].legends
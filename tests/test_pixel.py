@@ -0,0 +1,67 @@
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from escodrinyar import Pixels, Plot
+from escodrinyar.marks.pixel import _PixelImage
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=2000),
+            "y": rng.normal(size=2000),
+            "g": rng.choice(["a", "b"], 2000),
+            "v": rng.uniform(size=2000),
+        }
+    )
+
+
+def images(layout):
+    layout.plot().fig.canvas.draw()
+    return [
+        artist
+        for sfig in layout.fig.subfigs
+        for ax in sfig.axes
+        for artist in ax.get_children()
+        if isinstance(artist, _PixelImage)
+    ]
+
+
+@pytest.mark.parametrize("color", [None, "g", "v"])
+def test_pixels_draw_one_image_per_axes(df, color):
+    variables = {} if color is None else {"color": color}
+    plot = Plot(data=df, x="x", y="y", **variables).add(Pixels())
+    assert len(images(plot.plot())) == 1
+
+
+def test_pixels_bin_points_into_axes_pixels(df):
+    fig = mpl.figure.Figure(figsize=(2, 1), dpi=100)
+    ax = fig.add_axes([0, 0, 1, 1], xlim=(-4, 4), ylim=(-4, 4))
+    calls = []
+
+    def colorize(flat, n, values):
+        calls.append((flat, n))
+        return np.zeros((n, 4))
+
+    ax.add_artist(_PixelImage(df[["x", "y"]].to_numpy(), colorize))
+    FigureCanvasAgg(fig).draw()
+    ((flat, n),) = calls
+    assert n == 200 * 100
+    assert len(flat) == ((df["x"].abs() < 4) & (df["y"].abs() < 4)).sum()
+
+
+def test_pixels_skip_empty_groups(df):
+    fig = mpl.figure.Figure()
+    ax = fig.add_subplot()
+
+    def split_gen():
+        yield {}, df.iloc[:0], ax
+        yield {}, df, ax
+
+    Pixels()._plot(split_gen, {}, "x")
+    assert len([a for a in ax.get_children() if isinstance(a, _PixelImage)]) == 1
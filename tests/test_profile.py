@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import seaborn.objects as so
+
+from escodrinyar import Agg2d, Plot, profile
+
+
+def test_record_stages():
+    df = pd.DataFrame({"x": np.arange(6.0), "y": np.arange(6.0), "g": list("aabbcc")})
+    plot = Plot(data=df, x="x", y="y", color="g").add(so.Dot()).add(so.Dot(), Agg2d())
+    layout = plot + plot
+    with profile.record() as report:
+        layout.plot()
+    frame = report.to_frame()
+    assert {"plot", "cell", "stat", "legend"} <= set(frame["name"])
+    assert sorted(frame.loc[frame["name"] == "cell", "cell"]) == [(0, 0), (0, 1)]
+    stats = frame[frame["category"] == "stat"]
+    assert list(stats["target"]) == ["Agg2d", "Agg2d"]
+    assert list(stats["layer"]) == [1, 1]
+    assert (frame["duration"] >= 0).all()
+    trace = report.to_chrome_trace()
+    assert len(trace["traceEvents"]) == len(frame)
+    assert not profile.is_recording()
+
+
+def test_record_memory():
+    df = pd.DataFrame({"x": np.arange(6.0), "y": np.arange(6.0)})
+    with profile.record(memory=True) as report:
+        Plot(data=df, x="x", y="y").add(so.Dot()).plot()
+    assert all("peak" in event for event in report.events)
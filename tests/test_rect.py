@@ -0,0 +1,83 @@
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+import seaborn as sns
+import seaborn.objects as so
+
+from escodrinyar import HexTile, Plot, Rect, Tile
+from escodrinyar.marks.rect import _regular_grid
+
+
+def grid(nx=4, ny=3):
+    x, y = np.meshgrid(np.arange(nx), np.arange(ny))
+    return pd.DataFrame(
+        {"x": x.ravel(), "y": y.ravel(), "g": np.where(x.ravel() % 2, "b", "a")}
+    )
+
+
+def axes(plot):
+    return plot.plot().fig.subfigs[0].axes[0]
+
+
+def collections(ax):
+    return [c for c in ax.collections if isinstance(c, mpl.collections.PolyCollection)]
+
+
+def test_rect_single_artist_per_axes():
+    df = pd.DataFrame(
+        {"x": [0, 1, 2], "xmin": [0, 1, 2], "xmax": [0.5, 1.5, 2.5],
+         "ymin": [0, 0, 0], "ymax": [1, 2, 3], "g": ["a", "b", "c"]}
+    )
+    p = Plot(data=df, xmin="xmin", xmax="xmax", ymin="ymin", ymax="ymax", color="g")
+    ax = axes(p.add(Rect()))
+    artists = collections(ax)
+    assert len(artists) == 1
+    assert len(artists[0].get_paths()) == 3
+
+
+def test_tile_levels_stack_in_order():
+    df = pd.DataFrame({"x": [0, 0, 0], "y": [0, 0, 0], "g": ["b", "a", "b"]})
+    p = Plot(data=df, x="x", y="y", color="g").add(Tile())
+    ax = axes(p.scale(color=so.Nominal(order=["a", "b"])))
+    (artist,) = collections(ax)
+    colors = artist.get_facecolors()
+    # Levels are drawn in their order, as they would be with one artist each
+    a, b = mpl.colors.to_rgba_array(sns.color_palette("deep", 2))
+    assert np.allclose(colors, [a, b, b])
+
+
+def test_tile_raster_draws_an_image():
+    df = grid()
+    ax = axes(Plot(data=df, x="x", y="y", color="g").add(Tile(raster=True)))
+    assert len(ax.images) == 1 and not collections(ax)
+    assert np.allclose(ax.images[0].get_extent(), [-0.5, 3.5, -0.5, 2.5])
+
+
+def test_tile_raster_falls_back_off_grid():
+    df = grid().assign(x=lambda d: d["x"] * [1, 1.5, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1])
+    ax = axes(Plot(data=df, x="x", y="y").add(Tile(raster=True)))
+    assert not ax.images and len(collections(ax)) == 1
+
+
+def test_regular_grid():
+    verts = np.array([[0, 1, 0, 1], [2, 3, 0, 1], [1, 2, 1, 2]], dtype=float)
+    i, j, nx, ny = _regular_grid(verts)
+    assert list(i) == [0, 2, 1] and list(j) == [0, 0, 1] and (nx, ny) == (3, 2)
+    assert _regular_grid(np.array([[0, 1, 0, 1], [0.5, 1.5, 0, 1.0]])) is None
+
+
+def test_hex_tile_draws_hexagons():
+    ax = axes(Plot(data=grid(), x="x", y="y").add(HexTile()))
+    (artist,) = collections(ax)
+    assert len(artist.get_paths()) == 12
+    assert len(artist.get_paths()[0].vertices) >= 6
+
+
+def test_rects_outside_fixed_limits_are_culled():
+    df = grid(nx=100, ny=1)
+    p = Plot(data=df, x="x", y="y").add(Tile())
+    ax = axes(p.limit(x=(-0.5, 9.5)))
+    (artist,) = collections(ax)
+    assert 10 <= len(artist.get_paths()) < 20
+    # The data limits still cover every rectangle
+    assert ax.dataLim.x1 == 99.5
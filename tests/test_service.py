@@ -0,0 +1,62 @@
+import io
+
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+import seaborn.objects as so
+from seaborn.objects import Plot as SeabornPlot
+
+from escodrinyar import Layout, Plot, RenderService
+from escodrinyar.service import _copy, _render
+
+
+def plot():
+    df = pd.DataFrame({"x": np.arange(5.0), "y": np.arange(5.0)})
+    return Plot(data=df, x="x", y="y").add(so.Dot())
+
+
+def test_render_formats():
+    with RenderService(processes=False) as service:
+        assert service.render(plot()).startswith(b"\x89PNG")
+        assert b"<svg" in service.render(plot(), format="svg", dpi=50)
+        assert service.metrics()["completed"] == 2
+
+
+def test_render_with_format_in_savefig_kwargs():
+    state = (dict(mpl.rcParams), dict(SeabornPlot.config.theme), Layout.legend)
+    image, _ = _render(Layout([[plot()]]), "svg", {"format": "png", "dpi": 50}, state)
+    assert b"<svg" in image
+
+
+def test_services_keep_their_own_settings():
+    def corner(service):
+        image = service.render(plot(), dpi=20)
+        return tuple(mpl.image.imread(io.BytesIO(image))[0, 0, :3])
+
+    with mpl.rc_context({"figure.facecolor": "red"}):
+        red = RenderService(processes=False)
+    with mpl.rc_context({"figure.facecolor": "blue"}):
+        blue = RenderService(processes=False)
+    with red, blue:
+        assert corner(red) == (1, 0, 0)
+        assert corner(blue) == (0, 0, 1)
+        assert corner(red) == (1, 0, 0)
+
+
+def test_renders_copy_the_data():
+    df = pd.DataFrame({"x": np.arange(5.0), "y": np.arange(5.0)})
+    a = Plot(data=df, x="x", y="y").add(so.Dot())
+    b = Plot(data=df, x="x", y="y").add(so.Line(), data=df, y="x")
+    with RenderService(processes=False) as service:
+        image = service.render(a + b)
+    layout = _copy(a + b)
+    df.loc[0, "x"] = 100
+    df.loc[0, "y"] = 100
+    (copied_a, copied_b), = layout.layout
+    frame = copied_a.splot._data.source_data
+    assert frame is not df and frame.loc[0, "x"] == 0
+    # Data shared by cells and layers stays shared
+    assert copied_b.splot._data.source_data is frame
+    assert copied_b.splot._layers[0]["source"] is frame
+    with RenderService(processes=False) as service:
+        assert service.render(layout) == image
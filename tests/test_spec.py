@@ -0,0 +1,69 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from escodrinyar import Layout, spec
+from escodrinyar.cli import main
+
+
+@pytest.fixture
+def spec_path(tmp_path):
+    rng = np.random.default_rng(0)
+    pd.DataFrame(
+        {"a": rng.normal(size=20), "b": rng.normal(size=20), "g": ["p", "q"] * 10}
+    ).to_csv(tmp_path / "data.csv", index=False)
+    config = {
+        "data": {"d": "data.csv"},
+        "plots": {
+            "points": {
+                "data": "d", "x": "a", "y": "b", "color": "g",
+                "layers": [{"mark": {"type": "Dot", "pointsize": 2}}],
+            },
+            "means": {
+                "data": "d", "x": "a", "y": "b",
+                "layers": [{"mark": "Dot", "transforms": ["Agg2d"]}],
+            },
+        },
+        "layout": [["points", ["points", "means"]]],
+        "opts": {"figsize": [6, 3]},
+        "output": ["out.png", "out.svg"],
+    }
+    path = tmp_path / "layout.json"
+    path.write_text(json.dumps(config))
+    return path
+
+
+def test_build(spec_path):
+    layout = spec.build(spec.load(spec_path), spec_path.parent)
+    assert isinstance(layout, Layout)
+    assert layout.figsize == [6, 3]
+    assert len(layout.layout[0][1].splot._layers) == 2
+
+
+def test_unknown_names(spec_path):
+    config = spec.load(spec_path)
+    with pytest.raises(ValueError, match="Unknown plot"):
+        spec.build({**config, "layout": [["lines"]]}, spec_path.parent)
+    config["plots"]["points"]["layers"] = [{"mark": {"type": "Nothing"}}]
+    with pytest.raises(ValueError, match="Unknown type"):
+        spec.build(config, spec_path.parent)
+
+
+def test_cli_writes_outputs(spec_path, tmp_path, capsys):
+    assert main([str(spec_path), "--dpi", "50"]) == 0
+    assert (tmp_path / "out.png").read_bytes().startswith(b"\x89PNG")
+    assert b"<svg" in (tmp_path / "out.svg").read_bytes()
+    assert capsys.readouterr().out.split() == [
+        str(tmp_path / "out.png"), str(tmp_path / "out.svg")
+    ]
+
+
+def test_cli_reports_failures(spec_path, tmp_path, capsys):
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"plots": {}}))
+    out = tmp_path / "out"
+    assert main([str(bad), str(spec_path), "-o", str(out)]) == 1
+    assert "needs a `layout`" in capsys.readouterr().err
+    assert (out / "out.png").exists()